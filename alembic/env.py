@@ -13,10 +13,11 @@ load_dotenv()
 
 # Import shared base
 from common.infrastructure.database.base import Base
+from common.infrastructure.database.session import to_sync_url
 
 # Import all models so Alembic can detect them
 from auth.infrastructure.database.models import UserModel  # noqa: F401
-from emotions.infrastructure.database.models import EmotionModel  # noqa: F401
+from emotions.infrastructure.database.models import EmotionModel, UserStreakModel  # noqa: F401
 
 # Alembic Config
 config = context.config
@@ -38,7 +39,7 @@ def run_migrations_offline() -> None:
     """Run migrations in offline mode."""
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
-        url=url,
+        url=to_sync_url(url),
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
@@ -55,9 +56,9 @@ def run_migrations_online() -> None:
     if not database_url:
         raise ValueError("DATABASE_URL environment variable is not set")
     
-    # Create engine directly with the URL
+    # Create engine directly with the URL (migrations always use the sync driver)
     from sqlalchemy import create_engine
-    connectable = create_engine(database_url)
+    connectable = create_engine(to_sync_url(database_url))
 
     with connectable.connect() as connection:
         context.configure(
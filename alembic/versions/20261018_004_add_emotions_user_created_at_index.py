@@ -0,0 +1,40 @@
+"""Add composite index for per-user emotion listings
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create (user_id, created_at DESC, id DESC) index without blocking writes."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_emotions_user_id_created_at_id',
+            'emotions',
+            ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the composite index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_emotions_user_id_created_at_id',
+            table_name='emotions',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
@@ -0,0 +1,47 @@
+"""Add user_streaks read model
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create user_streaks table.
+    
+    Populate it afterwards with:
+        python -m emotions.infrastructure.commands.rebuild_streaks
+    Until then GetStreak computes from emotions for users without a row;
+    a user's row is created from their full history on their next emotion.
+    """
+    op.create_table(
+        'user_streaks',
+        sa.Column('user_id', UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column('current_streak', sa.Integer(), nullable=False),
+        sa.Column('longest_streak', sa.Integer(), nullable=False),
+        sa.Column('last_emotion_date', sa.Date(), nullable=False),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now()
+        ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    )
+
+
+def downgrade() -> None:
+    """Drop user_streaks table."""
+    op.drop_table('user_streaks')
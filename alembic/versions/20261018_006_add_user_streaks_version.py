@@ -0,0 +1,33 @@
+"""Add version counter to user_streaks
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add version column, bumped whenever a user's emotions change.
+    
+    Existing rows start at 1 so they differ from users without a row (0).
+    """
+    op.add_column(
+        'user_streaks',
+        sa.Column('version', sa.BigInteger(), nullable=False, server_default='1')
+    )
+
+
+def downgrade() -> None:
+    """Drop version column."""
+    op.drop_column('user_streaks', 'version')
@@ -0,0 +1,60 @@
+"""Add full-text search vector to emotions
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+# revision identifiers
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match EmotionModel.search_vector
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('spanish', title), 'A') || "
+    "setweight(to_tsvector('spanish', text), 'B') || "
+    "setweight(to_tsvector('spanish', ai_response), 'C')"
+)
+
+
+def upgrade() -> None:
+    """Add generated search_vector column and its GIN index.
+    
+    Adding a stored generated column rewrites the table under an exclusive
+    lock; run it in a maintenance window on large tables. The index is then
+    built concurrently. The planner combines it with the user_id index
+    (BitmapAnd) when the search terms are selective.
+    """
+    op.add_column(
+        'emotions',
+        sa.Column('search_vector', TSVECTOR(), sa.Computed(SEARCH_VECTOR, persisted=True))
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_emotions_search_vector',
+            'emotions',
+            ['search_vector'],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Drop search index and column."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_emotions_search_vector',
+            table_name='emotions',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+    op.drop_column('emotions', 'search_vector')
@@ -0,0 +1,40 @@
+"""Add emotion_daily_counts rollup
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create emotion_daily_counts table.
+    
+    The (user_id, local_date) primary key serves calendar and stats reads
+    as one index range scan. Populate it afterwards with:
+        python -m emotions.infrastructure.commands.rebuild_daily_counts
+    """
+    op.create_table(
+        'emotion_daily_counts',
+        sa.Column('user_id', UUID(as_uuid=True), nullable=False),
+        sa.Column('local_date', sa.Date(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('user_id', 'local_date')
+    )
+
+
+def downgrade() -> None:
+    """Drop emotion_daily_counts table."""
+    op.drop_table('emotion_daily_counts')
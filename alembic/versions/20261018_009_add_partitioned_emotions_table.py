@@ -0,0 +1,174 @@
+"""Add monthly range-partitioned emotions table
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match EmotionModel.search_vector
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('spanish', title), 'A') || "
+    "setweight(to_tsvector('spanish', text), 'B') || "
+    "setweight(to_tsvector('spanish', ai_response), 'C')"
+)
+
+# Creates one partition per Colombia calendar month; existing months are
+# skipped. Rows already stored in the default partition for a new month are
+# moved into it, since PostgreSQL refuses to attach a range they occupy.
+CREATE_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_emotion_partitions(
+    parent regclass, first_month date, months integer
+)
+RETURNS integer
+LANGUAGE plpgsql AS $$
+DECLARE
+    month_start date;
+    partition_name text;
+    lower_bound timestamptz;
+    upper_bound timestamptz;
+    created integer := 0;
+BEGIN
+    FOR i IN 0 .. months - 1 LOOP
+        month_start := (date_trunc('month', first_month) + make_interval(months => i))::date;
+        partition_name := 'emotions_p' || to_char(month_start, 'YYYYMM');
+        CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+        
+        lower_bound := month_start::timestamp AT TIME ZONE 'America/Bogota';
+        upper_bound := (month_start + interval '1 month')::timestamp AT TIME ZONE 'America/Bogota';
+        
+        LOCK TABLE emotions_pdefault IN ACCESS EXCLUSIVE MODE;
+        EXECUTE format(
+            'CREATE TEMPORARY TABLE emotions_moved ON COMMIT DROP AS '
+            'SELECT id, user_id, title, text, ai_response, created_at FROM emotions_pdefault '
+            'WHERE created_at >= %L AND created_at < %L',
+            lower_bound, upper_bound
+        );
+        DELETE FROM emotions_pdefault WHERE created_at >= lower_bound AND created_at < upper_bound;
+        
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF %s FOR VALUES FROM (%L) TO (%L)',
+            partition_name, parent, lower_bound, upper_bound
+        );
+        EXECUTE format(
+            'INSERT INTO %s (id, user_id, title, text, ai_response, created_at) '
+                || 'SELECT * FROM emotions_moved',
+            parent
+        );
+        DROP TABLE emotions_moved;
+        created := created + 1;
+    END LOOP;
+    RETURN created;
+END
+$$
+"""
+
+# Applies writes on the old table to the partitioned one until the swap
+MIRROR_FUNCTION = """
+CREATE OR REPLACE FUNCTION mirror_emotion_changes()
+RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        DELETE FROM emotions_partitioned p
+        USING old_rows o
+        WHERE p.id = o.id AND p.created_at = o.created_at;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO emotions_partitioned (id, user_id, title, text, ai_response, created_at)
+        SELECT id, user_id, title, text, ai_response, created_at FROM new_rows
+        ON CONFLICT DO NOTHING;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+# Statement-level with transition tables, so bulk writes pay once per statement
+MIRROR_TRIGGERS = (
+    "CREATE TRIGGER mirror_emotion_inserts AFTER INSERT ON emotions "
+    "REFERENCING NEW TABLE AS new_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION mirror_emotion_changes()",
+    "CREATE TRIGGER mirror_emotion_updates AFTER UPDATE ON emotions "
+    "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION mirror_emotion_changes()",
+    "CREATE TRIGGER mirror_emotion_deletes AFTER DELETE ON emotions "
+    "REFERENCING OLD TABLE AS old_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION mirror_emotion_changes()",
+)
+
+
+def upgrade() -> None:
+    """Create emotions_partitioned alongside emotions and mirror writes into it.
+    
+    The primary key becomes (id, created_at): PostgreSQL requires unique
+    constraints on a partitioned table to include the partition key.
+    Partitions cover every month with existing emotions up to three months
+    ahead; rows outside them go to the default partition.
+    
+    Existing rows are copied online afterwards with:
+        python -m emotions.infrastructure.commands.backfill_emotion_partitions
+    and migration 010 swaps the tables. Writes keep going to emotions and
+    are mirrored by triggers meanwhile.
+    """
+    op.execute(f"""
+        CREATE TABLE emotions_partitioned (
+            id uuid NOT NULL,
+            user_id uuid NOT NULL REFERENCES users (id),
+            title varchar(100) NOT NULL,
+            text text NOT NULL,
+            ai_response text NOT NULL,
+            created_at timestamptz NOT NULL DEFAULT now(),
+            search_vector tsvector GENERATED ALWAYS AS ({SEARCH_VECTOR}) STORED,
+            CONSTRAINT emotions_partitioned_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute(
+        "CREATE INDEX ix_emotions_partitioned_user_id_created_at_id "
+        "ON emotions_partitioned (user_id, created_at DESC, id DESC)"
+    )
+    op.execute(
+        "CREATE INDEX ix_emotions_partitioned_search_vector "
+        "ON emotions_partitioned USING gin (search_vector)"
+    )
+    op.execute("CREATE TABLE emotions_pdefault PARTITION OF emotions_partitioned DEFAULT")
+    
+    op.execute(CREATE_PARTITIONS_FUNCTION)
+    op.execute("""
+        SELECT create_emotion_partitions(
+            'emotions_partitioned',
+            bounds.first_month,
+            ((extract(year FROM age(bounds.current_month, bounds.first_month)) * 12
+              + extract(month FROM age(bounds.current_month, bounds.first_month)))::integer + 4)
+        )
+        FROM (
+            SELECT
+                date_trunc('month', coalesce(
+                    (SELECT min(created_at) FROM emotions) AT TIME ZONE 'America/Bogota',
+                    now() AT TIME ZONE 'America/Bogota'
+                ))::date AS first_month,
+                date_trunc('month', now() AT TIME ZONE 'America/Bogota')::date AS current_month
+        ) AS bounds
+    """)
+    
+    op.execute(MIRROR_FUNCTION)
+    for trigger in MIRROR_TRIGGERS:
+        op.execute(trigger)
+
+
+def downgrade() -> None:
+    """Drop mirror triggers, helper functions and the partitioned table."""
+    for name in ("mirror_emotion_inserts", "mirror_emotion_updates", "mirror_emotion_deletes"):
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON emotions")
+    op.execute("DROP FUNCTION IF EXISTS mirror_emotion_changes()")
+    op.execute("DROP TABLE emotions_partitioned")
+    op.execute("DROP FUNCTION IF EXISTS create_emotion_partitions(regclass, date, integer)")
@@ -0,0 +1,104 @@
+"""Swap emotions for the partitioned table
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = "id, user_id, title, text, ai_response, created_at"
+
+# (old name, new name) of the constraints and indexes renamed with the tables
+LEGACY_RENAMES = (
+    ("CONSTRAINT", "emotions_pkey", "emotions_legacy_pkey"),
+    ("CONSTRAINT", "emotions_user_id_fkey", "emotions_legacy_user_id_fkey"),
+    ("INDEX", "ix_emotions_user_id_created_at_id", "ix_emotions_legacy_user_id_created_at_id"),
+    ("INDEX", "ix_emotions_search_vector", "ix_emotions_legacy_search_vector"),
+)
+PARTITIONED_RENAMES = (
+    ("CONSTRAINT", "emotions_partitioned_pkey", "emotions_pkey"),
+    ("CONSTRAINT", "emotions_partitioned_user_id_fkey", "emotions_user_id_fkey"),
+    ("INDEX", "ix_emotions_partitioned_user_id_created_at_id", "ix_emotions_user_id_created_at_id"),
+    ("INDEX", "ix_emotions_partitioned_search_vector", "ix_emotions_search_vector"),
+)
+
+MIRROR_TRIGGERS = (
+    "CREATE TRIGGER mirror_emotion_inserts AFTER INSERT ON emotions "
+    "REFERENCING NEW TABLE AS new_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION mirror_emotion_changes()",
+    "CREATE TRIGGER mirror_emotion_updates AFTER UPDATE ON emotions "
+    "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION mirror_emotion_changes()",
+    "CREATE TRIGGER mirror_emotion_deletes AFTER DELETE ON emotions "
+    "REFERENCING OLD TABLE AS old_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION mirror_emotion_changes()",
+)
+
+
+def _rename(table: str, renames: tuple, reverse: bool = False) -> None:
+    """Rename a table's constraints and indexes."""
+    for kind, old, new in renames:
+        if reverse:
+            old, new = new, old
+        if kind == "CONSTRAINT":
+            op.execute(f"ALTER TABLE {table} RENAME CONSTRAINT {old} TO {new}")
+        else:
+            op.execute(f"ALTER INDEX {old} RENAME TO {new}")
+
+
+def upgrade() -> None:
+    """Make the partitioned table the live emotions table.
+    
+    Holds an exclusive lock on both tables for the duration. After a
+    completed backfill only row counts are compared; otherwise missing rows
+    are copied here, under the lock. The old table is kept as
+    emotions_legacy for rollback; drop it once the swap is verified.
+    """
+    op.execute("LOCK TABLE emotions, emotions_partitioned IN ACCESS EXCLUSIVE MODE")
+    op.execute(f"""
+        DO $$
+        BEGIN
+            IF (SELECT count(*) FROM emotions) <> (SELECT count(*) FROM emotions_partitioned) THEN
+                INSERT INTO emotions_partitioned ({COLUMNS})
+                SELECT {COLUMNS} FROM emotions
+                ON CONFLICT DO NOTHING;
+            END IF;
+        END
+        $$
+    """)
+    
+    for name in ("mirror_emotion_inserts", "mirror_emotion_updates", "mirror_emotion_deletes"):
+        op.execute(f"DROP TRIGGER {name} ON emotions")
+    
+    op.execute("ALTER TABLE emotions RENAME TO emotions_legacy")
+    _rename("emotions_legacy", LEGACY_RENAMES)
+    op.execute("ALTER TABLE emotions_partitioned RENAME TO emotions")
+    _rename("emotions", PARTITIONED_RENAMES)
+
+
+def downgrade() -> None:
+    """Restore emotions_legacy as the live table, with rows written since the swap."""
+    op.execute("LOCK TABLE emotions, emotions_legacy IN ACCESS EXCLUSIVE MODE")
+    op.execute(f"""
+        INSERT INTO emotions_legacy ({COLUMNS})
+        SELECT {COLUMNS} FROM emotions
+        ON CONFLICT DO NOTHING
+    """)
+    
+    _rename("emotions", PARTITIONED_RENAMES, reverse=True)
+    op.execute("ALTER TABLE emotions RENAME TO emotions_partitioned")
+    _rename("emotions_legacy", LEGACY_RENAMES, reverse=True)
+    op.execute("ALTER TABLE emotions_legacy RENAME TO emotions")
+    
+    # Same triggers as migration 009
+    for trigger in MIRROR_TRIGGERS:
+        op.execute(trigger)
@@ -0,0 +1,53 @@
+"""Add emotion_archives cold storage
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+
+# revision identifiers
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create emotion_archives table.
+    
+    Emotions older than EMOTIONS_HOT_DAYS are moved here by:
+        python -m emotions.infrastructure.commands.archive_emotions
+    The (user_id, month) primary key is the only index: one entry per
+    user-month instead of one per emotion in each of the hot table's indexes.
+    """
+    op.create_table(
+        'emotion_archives',
+        sa.Column('user_id', UUID(as_uuid=True), nullable=False),
+        sa.Column('month', sa.Date(), nullable=False),
+        sa.Column('payload', JSONB(), nullable=False),
+        sa.Column('local_dates', ARRAY(sa.Date()), nullable=False),
+        sa.Column('first_created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('last_created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('user_id', 'month')
+    )
+
+
+def downgrade() -> None:
+    """Move archived emotions back into emotions and drop emotion_archives."""
+    op.execute("""
+        INSERT INTO emotions (id, user_id, title, text, ai_response, created_at)
+        SELECT r.id, a.user_id, r.title, r.text, r.ai_response, r.created_at
+        FROM emotion_archives a,
+            jsonb_to_recordset(a.payload) AS r(
+                id uuid, title varchar(100), text text, ai_response text, created_at timestamptz
+            )
+        ON CONFLICT DO NOTHING
+    """)
+    op.drop_table('emotion_archives')
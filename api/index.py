@@ -1,14 +1,28 @@
 """FastAPI application for Vercel serverless deployment."""
 
-from dotenv import load_dotenv
+import os
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file (Vercel injects them directly)
+if not os.getenv("VERCEL"):
+    from dotenv import load_dotenv
+    load_dotenv()
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
+from auth.application.services.password_hasher import get_password_hasher, shutdown_password_hasher
 from auth.infrastructure.api.routes import router as auth_router
+from common.infrastructure.auth.token_cache import get_token_cache
+from common.infrastructure.cache.read_cache import get_read_cache
+from common.infrastructure.database.session import dispose_engines, get_pool_stats
+from common.infrastructure.observability.metrics import (
+    MetricsMiddleware,
+    get_metrics_registry,
+    render_gauges
+)
+from common.infrastructure.observability.query_stats import ServerTimingMiddleware
+from common.infrastructure.warmup import warmup, warmup_enabled
 from emotions.infrastructure.api.routes import router as emotions_router
 
 # Create FastAPI app
@@ -27,6 +41,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request DB statement count and time as Server-Timing
+app.add_middleware(ServerTimingMiddleware)
+
+# Per-route request metrics (outermost, so it times the whole stack)
+app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(auth_router, prefix="/api", tags=["auth"])
 app.include_router(emotions_router, prefix="/api/emotions", tags=["emotions"])
@@ -38,4 +58,47 @@ async def root():
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return {
+        "status": "healthy",
+        "password_hasher": get_password_hasher().stats(),
+        "token_cache": get_token_cache().stats(),
+        "read_cache": get_read_cache().stats(),
+        "database_pool": get_pool_stats()
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics(authorization: str | None = Header(None)):
+    """Prometheus metrics endpoint.
+    
+    When METRICS_TOKEN is set, requires ``Authorization: Bearer <token>``.
+    """
+    token = os.getenv("METRICS_TOKEN")
+    if token and authorization != f"Bearer {token}":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token"
+        )
+    
+    body = (
+        get_metrics_registry().render()
+        + render_gauges("password_hasher", get_password_hasher().stats())
+        + render_gauges("token_cache", get_token_cache().stats())
+        + render_gauges("read_cache", get_read_cache().stats())
+        + render_gauges("database_pool", get_pool_stats())
+    )
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
+
+
+@app.on_event("startup")
+async def startup():
+    """Optionally prime connections and validators before traffic."""
+    if warmup_enabled():
+        await warmup(app)
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Release pooled database connections and the password hashing threads."""
+    shutdown_password_hasher()
+    await dispose_engines()
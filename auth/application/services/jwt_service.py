@@ -2,6 +2,7 @@
 
 import os
 from datetime import datetime, timedelta
+from functools import lru_cache
 from uuid import UUID
 
 import jwt
@@ -44,3 +45,9 @@ class JWTService:
             return None
         except jwt.InvalidTokenError:
             return None
+
+
+@lru_cache(maxsize=1)
+def get_jwt_service() -> JWTService:
+    """Get the app-lifetime JWT service."""
+    return JWTService()
@@ -0,0 +1,134 @@
+"""Password hashing service backed by a dedicated bounded executor."""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from auth.domain.exceptions.auth_errors import PasswordHasherOverloadedError
+from auth.domain.value_objects.password import HashedPassword
+
+
+class PasswordHasher:
+    """Run bcrypt work on its own thread pool with a bounded wait queue.
+    
+    bcrypt releases the GIL while hashing, so a small thread pool gives real
+    parallelism without the startup and pickling cost of a process pool, and
+    keeps password work away from the threadpool the rest of the API uses.
+    Callers beyond ``workers + queue_size`` admitted jobs, or waiting longer than
+    ``queue_timeout`` seconds, are rejected with PasswordHasherOverloadedError.
+    """
+    
+    def __init__(self, workers: int, queue_size: int, queue_timeout: float):
+        """Initialize executor and admission control."""
+        self.workers = workers
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="password-hasher"
+        )
+        self._slots = asyncio.Semaphore(workers)
+        
+        # Counters
+        self.queue_depth = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.hash_seconds_total = 0.0
+        self.hash_seconds_max = 0.0
+        self.queue_wait_seconds_total = 0.0
+    
+    @classmethod
+    def from_env(cls) -> "PasswordHasher":
+        """Create hasher sized from environment variables."""
+        return cls(
+            workers=int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1)))),
+            queue_size=int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "64")),
+            queue_timeout=float(os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT", "2.0"))
+        )
+    
+    async def hash(self, plain_password: str) -> HashedPassword:
+        """Hash a plain password."""
+        return await self._run(HashedPassword.from_plain, plain_password)
+    
+    async def verify(self, hashed_password: HashedPassword, plain_password: str) -> bool:
+        """Verify a plain password against a stored hash."""
+        return await self._run(hashed_password.verify, plain_password)
+    
+    def stats(self) -> dict:
+        """Snapshot of queue and latency counters."""
+        return {
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "hash_seconds_total": round(self.hash_seconds_total, 6),
+            "hash_seconds_max": round(self.hash_seconds_max, 6),
+            "queue_wait_seconds_total": round(self.queue_wait_seconds_total, 6),
+        }
+    
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting work; running hashes finish in the background unless wait."""
+        self._executor.shutdown(wait=wait)
+    
+    async def _run(self, func, *args):
+        """Admit a job to the executor, or reject it on overload."""
+        await self._acquire_slot()
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._executor, func, *args)
+        except BaseException:
+            self.failed += 1
+            raise
+        else:
+            self.completed += 1
+            return result
+        finally:
+            elapsed = time.perf_counter() - started
+            self.in_flight -= 1
+            self.hash_seconds_total += elapsed
+            self.hash_seconds_max = max(self.hash_seconds_max, elapsed)
+            self._slots.release()
+    
+    async def _acquire_slot(self) -> None:
+        """Reserve a place within the worker and queue bounds, then wait for a worker.
+        
+        The check and the reservation happen before the first await, so a
+        burst arriving in one event loop tick cannot overshoot the bound.
+        """
+        if self.in_flight + self.queue_depth >= self.workers + self.queue_size:
+            self.rejected += 1
+            raise PasswordHasherOverloadedError()
+        
+        self.queue_depth += 1
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise PasswordHasherOverloadedError()
+        else:
+            self.in_flight += 1
+        finally:
+            self.queue_depth -= 1
+            self.queue_wait_seconds_total += time.perf_counter() - started
+
+
+@lru_cache(maxsize=1)
+def get_password_hasher() -> PasswordHasher:
+    """Get the process-wide password hasher."""
+    return PasswordHasher.from_env()
+
+
+def shutdown_password_hasher() -> None:
+    """Shut down the process-wide hasher's executor, if it was created."""
+    if get_password_hasher.cache_info().currsize:
+        get_password_hasher().shutdown(wait=False)
+        get_password_hasher.cache_clear()
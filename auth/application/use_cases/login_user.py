@@ -3,6 +3,7 @@
 from auth.application.dtos.login_dto import LoginDTO
 from auth.application.dtos.token_dto import TokenDTO
 from auth.application.services.jwt_service import JWTService
+from auth.application.services.password_hasher import PasswordHasher
 from auth.domain.exceptions.auth_errors import InvalidCredentialsError
 from auth.domain.value_objects.email import Email
 
@@ -10,23 +11,24 @@ from auth.domain.value_objects.email import Email
 class LoginUser:
     """Login user and generate token."""
     
-    def __init__(self, repository, jwt_service: JWTService):
-        """Initialize with repository and JWT service."""
+    def __init__(self, repository, jwt_service: JWTService, password_hasher: PasswordHasher):
+        """Initialize with repository, JWT service and password hasher."""
         self.repository = repository
         self.jwt_service = jwt_service
+        self.password_hasher = password_hasher
     
-    def execute(self, data: LoginDTO) -> TokenDTO:
+    async def execute(self, data: LoginDTO) -> TokenDTO:
         """Execute login."""
         # Create email value object
         email = Email(value=data.email)
         
         # Find user
-        user = self.repository.find_by_email(email.value)
+        user = await self.repository.find_by_email(email.value)
         if not user:
             raise InvalidCredentialsError()
         
-        # Verify password
-        if not user.verify_password(data.password):
+        # Verify password on the dedicated executor
+        if not await self.password_hasher.verify(user.hashed_password, data.password):
             raise InvalidCredentialsError()
         
         # Generate token
@@ -2,30 +2,26 @@
 
 from auth.application.dtos.register_dto import RegisterDTO
 from auth.application.dtos.user_dto import UserDTO
+from auth.application.services.password_hasher import PasswordHasher
 from auth.domain.entities.user import User
-from auth.domain.exceptions.auth_errors import UserAlreadyExistsError
 from auth.domain.value_objects.email import Email
-from auth.domain.value_objects.password import HashedPassword
 
 
 class RegisterUser:
     """Register a new user."""
     
-    def __init__(self, repository):
-        """Initialize with repository."""
+    def __init__(self, repository, password_hasher: PasswordHasher):
+        """Initialize with repository and password hasher."""
         self.repository = repository
+        self.password_hasher = password_hasher
     
-    def execute(self, data: RegisterDTO) -> UserDTO:
+    async def execute(self, data: RegisterDTO) -> UserDTO:
         """Execute registration."""
         # Create email value object
         email = Email(value=data.email)
         
-        # Check if user exists
-        if self.repository.exists_by_email(email.value):
-            raise UserAlreadyExistsError(email.value)
-        
-        # Hash password
-        hashed_password = HashedPassword.from_plain(data.password)
+        # Hash password on the dedicated executor
+        hashed_password = await self.password_hasher.hash(data.password)
         
         # Create user entity
         user = User(
@@ -34,8 +30,8 @@ class RegisterUser:
             hashed_password=hashed_password
         )
         
-        # Save user
-        created_user = self.repository.create(user)
+        # Save user; raises UserAlreadyExistsError if the email is taken
+        created_user = await self.repository.create(user)
         
         # Return DTO
         return UserDTO(
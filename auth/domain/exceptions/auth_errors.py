@@ -27,3 +27,11 @@ class UserNotFoundError(AuthError):
     def __init__(self, email: str):
         self.email = email
         super().__init__(f"User not found: {email}")
+
+
+class PasswordHasherOverloadedError(AuthError):
+    """Password hashing capacity is exhausted."""
+    
+    def __init__(self, retry_after: int = 1):
+        self.retry_after = retry_after
+        super().__init__("Password hashing is temporarily overloaded")
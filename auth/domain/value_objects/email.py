@@ -4,6 +4,8 @@ import re
 
 from pydantic import BaseModel, validator
 
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 
 class Email(BaseModel):
     """Email value object with validation."""
@@ -17,10 +19,23 @@ class Email(BaseModel):
     @validator('value')
     def validate_email(cls, v):
         """Validate email format."""
-        pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-        if not v or not pattern.match(v):
+        if not v or not _EMAIL_PATTERN.match(v):
             raise ValueError(f"Invalid email format: {v}")
         return v
     
+    @classmethod
+    def from_trusted(cls, value: str) -> 'Email':
+        """Wrap an email validated on write, e.g. a stored one, skipping validation.
+        
+        Sets pydantic's instance state directly: model_construct() costs more
+        than the validation it skips for a single-field model.
+        """
+        email = object.__new__(cls)
+        object.__setattr__(email, '__dict__', {'value': value})
+        object.__setattr__(email, '__pydantic_fields_set__', {'value'})
+        object.__setattr__(email, '__pydantic_extra__', None)
+        object.__setattr__(email, '__pydantic_private__', None)
+        return email
+    
     def __str__(self) -> str:
         return self.value
@@ -1,6 +1,8 @@
-"""Password value object with hashing."""
+"""Password value object with hashing.
 
-import bcrypt
+bcrypt is imported lazily: only /register and /login need it, so other
+routes (and serverless cold starts) don't pay for loading it.
+"""
 
 from pydantic import BaseModel
 
@@ -16,6 +18,8 @@ class HashedPassword(BaseModel):
     
     def verify(self, plain_password: str) -> bool:
         """Verify plain password against hash."""
+        import bcrypt
+        
         try:
             return bcrypt.checkpw(
                 plain_password.encode('utf-8'),
@@ -24,12 +28,24 @@ class HashedPassword(BaseModel):
         except Exception:
             return False
     
+    @classmethod
+    def from_trusted(cls, value: str) -> 'HashedPassword':
+        """Wrap a stored hash, skipping validation like Email.from_trusted()."""
+        hashed_password = object.__new__(cls)
+        object.__setattr__(hashed_password, '__dict__', {'value': value})
+        object.__setattr__(hashed_password, '__pydantic_fields_set__', {'value'})
+        object.__setattr__(hashed_password, '__pydantic_extra__', None)
+        object.__setattr__(hashed_password, '__pydantic_private__', None)
+        return hashed_password
+    
     @staticmethod
     def from_plain(plain_password: str) -> 'HashedPassword':
         """Create hashed password from plain text."""
         if len(plain_password) < 8:
             raise ValueError("Password must be at least 8 characters")
         
+        import bcrypt
+        
         salt = bcrypt.gensalt()
         hashed = bcrypt.hashpw(plain_password.encode('utf-8'), salt)
         return HashedPassword(value=hashed.decode('utf-8'))
@@ -1,41 +1,54 @@
 """FastAPI routes for authentication."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from auth.application.dtos.login_dto import LoginDTO
 from auth.application.dtos.register_dto import RegisterDTO
 from auth.application.dtos.token_dto import TokenDTO
 from auth.application.dtos.user_dto import UserDTO
-from auth.application.services.jwt_service import JWTService
+from auth.application.services.jwt_service import get_jwt_service
+from auth.application.services.password_hasher import get_password_hasher
 from auth.application.use_cases.login_user import LoginUser
 from auth.application.use_cases.register_user import RegisterUser
 from auth.domain.exceptions.auth_errors import (
     UserAlreadyExistsError,
-    InvalidCredentialsError
+    InvalidCredentialsError,
+    PasswordHasherOverloadedError
 )
 from auth.infrastructure.database.repository import UserRepository
-from common.infrastructure.database.session import get_db_session
+from common.infrastructure.database.session import get_async_db_session
 
 # Router
 router = APIRouter()
 
 
+def _overloaded(error: PasswordHasherOverloadedError) -> HTTPException:
+    """Map password hasher overload to 503 Service Unavailable."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(error),
+        headers={"Retry-After": str(error.retry_after)}
+    )
+
+
 @router.post("/register", response_model=UserDTO, status_code=status.HTTP_201_CREATED)
-def register(
+async def register(
     data: RegisterDTO,
-    session: Session = Depends(get_db_session)
+    session: AsyncSession = Depends(get_async_db_session)
 ):
     """Register a new user."""
     try:
         repository = UserRepository(session)
-        use_case = RegisterUser(repository)
-        return use_case.execute(data)
+        use_case = RegisterUser(repository, get_password_hasher())
+        return await use_case.execute(data)
     except UserAlreadyExistsError as e:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"User with email '{e.email}' already exists"
         )
+    except PasswordHasherOverloadedError as e:
+        raise _overloaded(e)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -44,21 +57,22 @@ def register(
 
 
 @router.post("/login", response_model=TokenDTO)
-def login(
+async def login(
     data: LoginDTO,
-    session: Session = Depends(get_db_session)
+    session: AsyncSession = Depends(get_async_db_session)
 ):
     """Login and get JWT token."""
     try:
         repository = UserRepository(session)
-        jwt_service = JWTService()
-        use_case = LoginUser(repository, jwt_service)
-        return use_case.execute(data)
+        use_case = LoginUser(repository, get_jwt_service(), get_password_hasher())
+        return await use_case.execute(data)
     except InvalidCredentialsError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
+    except PasswordHasherOverloadedError as e:
+        raise _overloaded(e)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -1,83 +1,88 @@
-"""Add find_by_id method to UserRepository."""
+"""User repository implementation."""
 
 from uuid import UUID
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from auth.domain.entities.user import User
+from auth.domain.exceptions.auth_errors import UserAlreadyExistsError
 from auth.domain.value_objects.email import Email
 from auth.domain.value_objects.password import HashedPassword
 from auth.infrastructure.database.models import UserModel
 
 
+# Columns selected by reads and returned by writes, mapped by _to_entity
+_COLUMNS = (
+    UserModel.id,
+    UserModel.name,
+    UserModel.email,
+    UserModel.hashed_password,
+    UserModel.created_at
+)
+
+
+def _to_entity(row) -> User:
+    """Map database row to domain entity; stored values were validated on write."""
+    return User(
+        name=row.name,
+        email=Email.from_trusted(row.email),
+        hashed_password=HashedPassword.from_trusted(row.hashed_password),
+        id=row.id,
+        created_at=row.created_at
+    )
+
+
 class UserRepository:
-    """User repository with database operations."""
+    """User repository with async database operations."""
     
-    def __init__(self, session: Session):
-        """Initialize with database session."""
+    def __init__(self, session: AsyncSession):
+        """Initialize with async database session."""
         self.session = session
     
-    def exists_by_email(self, email: str) -> bool:
-        """Check if user exists with given email."""
-        stmt = select(UserModel).where(UserModel.email == email)
-        result = self.session.execute(stmt)
-        return result.scalar_one_or_none() is not None
-    
-    def find_by_id(self, user_id: UUID) -> User | None:
+    async def find_by_id(self, user_id: UUID) -> User | None:
         """Find user by ID."""
-        stmt = select(UserModel).where(UserModel.id == user_id)
-        result = self.session.execute(stmt)
-        model = result.scalar_one_or_none()
+        stmt = select(*_COLUMNS).where(UserModel.id == user_id)
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
         
-        if not model:
+        if not row:
             return None
         
-        return User(
-            name=model.name,
-            email=Email(value=model.email),
-            hashed_password=HashedPassword(value=model.hashed_password),
-            id=model.id,
-            created_at=model.created_at
-        )
+        return _to_entity(row)
     
-    def find_by_email(self, email: str) -> User | None:
+    async def find_by_email(self, email: str) -> User | None:
         """Find user by email."""
-        stmt = select(UserModel).where(UserModel.email == email)
-        result = self.session.execute(stmt)
-        model = result.scalar_one_or_none()
+        stmt = select(*_COLUMNS).where(UserModel.email == email)
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
         
-        if not model:
+        if not row:
             return None
         
-        # Map to domain entity
-        return User(
-            name=model.name,
-            email=Email(value=model.email),
-            hashed_password=HashedPassword(value=model.hashed_password),
-            id=model.id,
-            created_at=model.created_at
-        )
+        return _to_entity(row)
     
-    def create(self, user: User) -> User:
-        """Create new user."""
-        model = UserModel(
+    async def create(self, user: User) -> User:
+        """Create new user with a single INSERT ... ON CONFLICT DO NOTHING RETURNING.
+        
+        Raises:
+            UserAlreadyExistsError: If the email is already registered
+        """
+        stmt = insert(UserModel).values(
             id=user.id,
             name=user.name,
             email=user.email.value,
             hashed_password=user.hashed_password.value,
             created_at=user.created_at
-        )
+        ).on_conflict_do_nothing(
+            index_elements=[UserModel.email]
+        ).returning(*_COLUMNS)
+        
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
         
-        self.session.add(model)
-        self.session.flush()
-        self.session.refresh(model)
+        if not row:
+            raise UserAlreadyExistsError(user.email.value)
         
-        # Map back to domain entity
-        return User(
-            name=model.name,
-            email=Email(value=model.email),
-            hashed_password=HashedPassword(value=model.hashed_password),
-            id=model.id,
-            created_at=model.created_at
-        )
+        return _to_entity(row)
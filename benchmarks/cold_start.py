@@ -0,0 +1,113 @@
+"""Cold-start benchmark: process spawn to first 200 response.
+
+Starts ``uvicorn api.index:app`` in a fresh process, polls a URL until it
+answers 200 and records the elapsed time. Repeats to get a distribution and
+can compare against a stored baseline to flag regressions.
+
+Usage:
+    python -m benchmarks.cold_start [--runs 10] [--path /health]
+        [--json result.json] [--baseline baseline.json] [--tolerance 0.15]
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+
+def _free_port() -> int:
+    """Pick an unused local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_once(path: str, timeout: float, warmup: bool) -> float:
+    """Spawn a server and return seconds until path first answers 200."""
+    port = _free_port()
+    env = {**os.environ, "WARMUP_ON_STARTUP": "true" if warmup else "false"}
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "api.index:app",
+            "--port", str(port), "--log-level", "warning"
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE
+    )
+    try:
+        url = f"http://127.0.0.1:{port}{path}"
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"Server exited early:\n{process.stderr.read().decode()}")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.005)
+        raise TimeoutError(f"No 200 from {url} within {timeout}s")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def summarize(samples: list[float]) -> dict:
+    """Summary statistics in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "runs": len(ordered),
+        "min_ms": ordered[0] * 1000,
+        "median_ms": statistics.median(ordered) * 1000,
+        "max_ms": ordered[-1] * 1000,
+        "samples_ms": [sample * 1000 for sample in samples]
+    }
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--path", default="/health", help="URL path that must answer 200")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--warmup", action="store_true", help="Enable WARMUP_ON_STARTUP")
+    parser.add_argument("--json", dest="json_path", help="Write result to this file")
+    parser.add_argument("--baseline", help="Compare median against this result file")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.15, help="Allowed median slowdown (fraction)"
+    )
+    args = parser.parse_args()
+    
+    result = summarize(
+        [measure_once(args.path, args.timeout, args.warmup) for _ in range(args.runs)]
+    )
+    print(
+        f"Cold start to first 200 on {args.path}: "
+        f"min {result['min_ms']:.0f} ms, median {result['median_ms']:.0f} ms, "
+        f"max {result['max_ms']:.0f} ms "
+        f"({result['runs']} runs)"
+    )
+    
+    if args.json_path:
+        with open(args.json_path, "w") as output:
+            json.dump(result, output, indent=2)
+    
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        limit = baseline["median_ms"] * (1 + args.tolerance)
+        if result["median_ms"] > limit:
+            print(f"REGRESSION: median {result['median_ms']:.0f} ms > {limit:.0f} ms allowed")
+            sys.exit(1)
+        print(f"OK: within {args.tolerance:.0%} of baseline median {baseline['median_ms']:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""End-to-end load benchmark for the API.
+
+Simulates concurrent users, each registering and logging in once and then
+looping over a weighted mix of create emotion, list, streak and login
+requests. Reports throughput and p50/p95/p99 latency per endpoint, and can
+compare against a stored baseline to flag regressions.
+
+By default the app is driven in-process through httpx's ASGI transport
+(needs DATABASE_URL pointing at a local Postgres with migrations applied);
+pass --url to load a running server instead, e.g. a local uvicorn.
+Requires httpx (``pip install httpx``), which the API itself does not need.
+
+Usage:
+    python -m benchmarks.load [--users 20] [--duration 30] [--url http://127.0.0.1:8000]
+        [--json result.json] [--baseline baseline.json] [--tolerance 0.15]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+
+import httpx
+
+# Relative weight of each step in a user's loop
+MIX = {
+    "create_emotion": 3,
+    "list_emotions": 4,
+    "streak": 3,
+    "login": 1,
+}
+
+PASSWORD = "benchmark-password"
+
+
+class Recorder:
+    """Latency samples and failures per endpoint."""
+    
+    def __init__(self):
+        """Initialize empty samples."""
+        self.samples: dict[str, list[float]] = {}
+        self.errors: dict[str, int] = {}
+    
+    async def call(self, name: str, request, expected_status: int) -> httpx.Response:
+        """Time one request; non-expected status codes count as errors."""
+        started = time.perf_counter()
+        response = await request
+        self.samples.setdefault(name, []).append(time.perf_counter() - started)
+        if response.status_code != expected_status:
+            self.errors[name] = self.errors.get(name, 0) + 1
+        return response
+
+
+async def run_user(
+    client: httpx.AsyncClient,
+    recorder: Recorder,
+    rng: random.Random,
+    deadline: float
+) -> None:
+    """One simulated user: register, log in, then loop the mix until deadline."""
+    email = f"bench-{uuid.uuid4().hex}@example.com"
+    credentials = {"email": email, "password": PASSWORD}
+    
+    await recorder.call(
+        "register",
+        client.post("/api/register", json={"name": "Benchmark", **credentials}),
+        201
+    )
+    response = await recorder.call("login", client.post("/api/login", json=credentials), 200)
+    if response.status_code != 200:
+        return
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    
+    steps, weights = list(MIX), list(MIX.values())
+    while time.perf_counter() < deadline:
+        step = rng.choices(steps, weights)[0]
+        if step == "create_emotion":
+            payload = {
+                "title": f"Emotion {rng.randint(1, 1000)}",
+                "text": "Hoy me siento tranquilo " * rng.randint(1, 20),
+                "ai_response": "Gracias por compartir"
+            }
+            await recorder.call(
+                step,
+                client.post("/api/emotions", json=payload, headers=headers),
+                201
+            )
+        elif step == "list_emotions":
+            await recorder.call(
+                step,
+                client.get("/api/emotions", params={"limit": 20}, headers=headers),
+                200
+            )
+        elif step == "streak":
+            await recorder.call(step, client.get("/api/emotions/streak", headers=headers), 200)
+        else:
+            await recorder.call(step, client.post("/api/login", json=credentials), 200)
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted samples."""
+    index = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(recorder: Recorder, elapsed: float) -> dict:
+    """Throughput and latency percentiles (milliseconds) per endpoint."""
+    endpoints = {}
+    for name, samples in sorted(recorder.samples.items()):
+        ordered = sorted(samples)
+        endpoints[name] = {
+            "requests": len(ordered),
+            "errors": recorder.errors.get(name, 0),
+            "rps": len(ordered) / elapsed,
+            "p50_ms": _percentile(ordered, 0.50) * 1000,
+            "p95_ms": _percentile(ordered, 0.95) * 1000,
+            "p99_ms": _percentile(ordered, 0.99) * 1000,
+        }
+    total = sum(endpoint["requests"] for endpoint in endpoints.values())
+    return {
+        "elapsed_s": elapsed,
+        "requests": total,
+        "errors": sum(endpoint["errors"] for endpoint in endpoints.values()),
+        "rps": total / elapsed,
+        "endpoints": endpoints
+    }
+
+
+def compare(result: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Regressions of result against baseline beyond tolerance."""
+    regressions = []
+    if result["rps"] < baseline["rps"] * (1 - tolerance):
+        regressions.append(
+            f"throughput {result['rps']:.1f} rps < {baseline['rps']:.1f} rps baseline"
+        )
+    for name, expected in baseline["endpoints"].items():
+        actual = result["endpoints"].get(name)
+        if actual is None:
+            continue
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            if actual[metric] > expected[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{name} {metric} {actual[metric]:.1f} > {expected[metric]:.1f} baseline"
+                )
+    return regressions
+
+
+async def run(users: int, duration: float, url: str | None, seed: int) -> dict:
+    """Run the workload and return its summary."""
+    if url:
+        client = httpx.AsyncClient(base_url=url, timeout=30)
+    else:
+        from api.index import app
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark")
+    
+    recorder = Recorder()
+    started = time.perf_counter()
+    async with client:
+        await asyncio.gather(*(
+            run_user(client, recorder, random.Random(seed + index), started + duration)
+            for index in range(users)
+        ))
+    elapsed = time.perf_counter() - started
+    
+    if not url:
+        from common.infrastructure.database.session import dispose_engines
+        await dispose_engines()
+    return summarize(recorder, elapsed)
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="End-to-end load benchmark")
+    parser.add_argument("--users", type=int, default=20, help="Concurrent simulated users")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run")
+    parser.add_argument("--url", help="Base URL of a running server (default: in-process)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the request mix")
+    parser.add_argument("--json", dest="json_path", help="Write result to this file")
+    parser.add_argument("--baseline", help="Compare against this result file")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed slowdown (fraction)")
+    args = parser.parse_args()
+    
+    result = asyncio.run(run(args.users, args.duration, args.url, args.seed))
+    print(
+        f"{'endpoint':<16}{'requests':>10}{'errors':>8}{'rps':>9}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    )
+    for name, endpoint in result["endpoints"].items():
+        print(
+            f"{name:<16}{endpoint['requests']:>10}{endpoint['errors']:>8}{endpoint['rps']:>9.1f}"
+            f"{endpoint['p50_ms']:>9.1f}{endpoint['p95_ms']:>9.1f}{endpoint['p99_ms']:>9.1f}"
+        )
+    print(
+        f"Total: {result['requests']} requests, {result['errors']} errors, "
+        f"{result['rps']:.1f} rps"
+    )
+    
+    if args.json_path:
+        with open(args.json_path, "w") as output:
+            json.dump(result, output, indent=2)
+    
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(result, baseline, args.tolerance)
+        if regressions:
+            for regression in regressions:
+                print(f"REGRESSION: {regression}")
+            sys.exit(1)
+        print(f"OK: within {args.tolerance:.0%} of baseline")
+
+
+if __name__ == "__main__":
+    main()
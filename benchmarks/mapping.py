@@ -0,0 +1,127 @@
+"""Micro-benchmark: per-row cost of mapping database rows to domain entities.
+
+Compares the previous mapping, where entities were pydantic models validated
+per row, with the repositories' current ``_to_entity`` building slotted
+dataclasses, on synthetic rows shaped like the ones the repositories select.
+No database needed.
+
+Usage:
+    python -m benchmarks.mapping [--rows 10000] [--repeat 5] [--json result.json]
+"""
+
+import argparse
+import json
+import timeit
+from collections import namedtuple
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel, Field
+
+from auth.domain.value_objects.email import Email
+from auth.domain.value_objects.password import HashedPassword
+from auth.infrastructure.database.repository import _to_entity as user_to_entity
+from emotions.domain.entities.emotion import colombia_now
+from emotions.infrastructure.database.models import to_colombia
+from emotions.infrastructure.database.repository import _to_entity as emotion_to_entity
+
+UserRow = namedtuple("UserRow", "id name email hashed_password created_at")
+EmotionRow = namedtuple("EmotionRow", "id user_id title text ai_response created_at")
+
+# Shape of a real bcrypt hash; never verified here
+HASH = "$2b$12$" + "a" * 53
+
+
+class PydanticUser(BaseModel):
+    """User entity as it was before becoming a dataclass."""
+    
+    name: str
+    email: Email
+    hashed_password: HashedPassword
+    id: UUID = Field(default_factory=uuid4)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class PydanticEmotion(BaseModel):
+    """Emotion entity as it was before becoming a dataclass."""
+    
+    user_id: UUID
+    title: str
+    text: str
+    ai_response: str
+    id: UUID = Field(default_factory=uuid4)
+    created_at: datetime = Field(default_factory=colombia_now)
+
+
+def pydantic_user(row) -> PydanticUser:
+    """Previous mapping: validate every row into a pydantic entity."""
+    return PydanticUser(
+        name=row.name,
+        email=Email(value=row.email),
+        hashed_password=HashedPassword(value=row.hashed_password),
+        id=row.id,
+        created_at=row.created_at
+    )
+
+
+def pydantic_emotion(row) -> PydanticEmotion:
+    """Previous mapping: validate every row into a pydantic entity."""
+    return PydanticEmotion(
+        user_id=row.user_id,
+        title=row.title,
+        text=row.text,
+        ai_response=row.ai_response,
+        id=row.id,
+        created_at=to_colombia(row.created_at)
+    )
+
+
+def per_row_us(mapper, rows: list, repeat: int) -> float:
+    """Best-of-repeat microseconds per mapped row."""
+    timer = timeit.Timer(lambda: [mapper(row) for row in rows])
+    return min(timer.repeat(repeat=repeat, number=1)) / len(rows) * 1e6
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Row-to-entity mapping micro-benchmark")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", dest="json_path", help="Write result to this file")
+    args = parser.parse_args()
+    
+    now = datetime.now(timezone.utc)
+    user_rows = [
+        UserRow(uuid4(), f"User {i}", f"user{i}@example.com", HASH, now.replace(tzinfo=None))
+        for i in range(args.rows)
+    ]
+    emotion_rows = [
+        EmotionRow(
+            uuid4(), uuid4(), "Feliz", "Hoy fue un buen día. " * 10, "Gracias por compartir.", now
+        )
+        for _ in range(args.rows)
+    ]
+    
+    result = {}
+    for name, rows, before, after in (
+        ("user", user_rows, pydantic_user, user_to_entity),
+        ("emotion", emotion_rows, pydantic_emotion, emotion_to_entity),
+    ):
+        result[name] = {
+            "before_us": per_row_us(before, rows, args.repeat),
+            "after_us": per_row_us(after, rows, args.repeat),
+        }
+        entry = result[name]
+        print(
+            f"{name:<8} before {entry['before_us']:.2f} us/row, "
+            f"after {entry['after_us']:.2f} us/row "
+            f"({entry['before_us'] / entry['after_us']:.1f}x faster)"
+        )
+    
+    if args.json_path:
+        with open(args.json_path, "w") as output:
+            json.dump(result, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""Bulk dataset seeder for scale testing.
+
+Generates users and emotions deterministically from a seed and loads them
+with PostgreSQL COPY into the existing ``users``/``emotions`` tables, then
+rebuilds the derived read models and runs ANALYZE.
+
+Users are drawn from three profiles so the data has realistic shape:
+casual users writing now and then, regular users with streaks and gaps,
+and heavy writers with long streaks and several emotions per day. Every
+user's data depends only on (seed, user index), so any number of workers
+produces the same dataset.
+
+Users are loaded first (emotions reference them), then emotions; each phase
+is split into shards copied in parallel by worker processes. All users share
+one precomputed bcrypt hash of ``--password``, so they can log in (e.g. from
+benchmarks.load) without paying bcrypt per row.
+
+Run against an empty, migrated database (DATABASE_URL). Monthly emotions
+partitions covering the generated history are created first.
+
+Usage:
+    python -m benchmarks.seed [--users 10000] [--days 365] [--seed 0] [--workers 4]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, time as day_time, timedelta, timezone
+from typing import Iterator
+
+import asyncpg
+from dotenv import load_dotenv
+from sqlalchemy.engine import make_url
+
+from auth.domain.value_objects.password import HashedPassword
+from auth.infrastructure.database.models import UserModel
+from emotions.infrastructure.database.models import COLOMBIA_TZ, EmotionModel, colombia_now
+
+# Rows per COPY call, bounding memory per worker
+COPY_CHUNK_SIZE = 50_000
+
+# (weight, P(active | active yesterday), P(active | inactive yesterday), max emotions per day)
+PROFILES = {
+    "casual": (0.6, 0.2, 0.08, 1),
+    "regular": (0.3, 0.85, 0.3, 2),
+    "heavy": (0.1, 0.97, 0.6, 3),
+}
+
+TITLES = (
+    "Feliz", "Triste", "Ansioso", "Tranquilo", "Cansado", "Motivado", "Frustrado", "Agradecido"
+)
+PHRASES = (
+    "Hoy fue un día largo en el trabajo.",
+    "Salí a caminar y me sentí mejor.",
+    "Hablé con mi familia por la tarde.",
+    "No dormí bien anoche.",
+    "Terminé un proyecto importante.",
+    "Me costó concentrarme.",
+    "Comí con amigos y nos reímos mucho.",
+    "Sentí presión por las fechas de entrega.",
+)
+AI_RESPONSES = (
+    "Gracias por compartir cómo te sientes.",
+    "Es normal tener días así; date un respiro.",
+    "Celebra tus logros, por pequeños que sean.",
+    "Intenta descansar y hablar con alguien de confianza.",
+)
+
+USER_COLUMNS = tuple(column.name for column in UserModel.__table__.columns)
+# Generated columns are computed by PostgreSQL and cannot be copied into
+EMOTION_COLUMNS = tuple(
+    column.name for column in EmotionModel.__table__.columns if column.computed is None
+)
+
+
+def _dsn() -> str:
+    """asyncpg DSN from DATABASE_URL."""
+    url = make_url(os.environ["DATABASE_URL"]).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+def _user(
+    seed: int,
+    index: int,
+    hashed_password: str,
+    start: datetime
+) -> tuple[dict, random.Random]:
+    """Generate one user and the random stream its emotions continue from."""
+    rng = random.Random(f"{seed}:{index}")
+    row = {
+        "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+        "name": f"Seed User {index}",
+        "email": f"seed-{index}@example.com",
+        "hashed_password": hashed_password,
+        # users.created_at is naive UTC
+        "created_at": (
+            start.astimezone(timezone.utc).replace(tzinfo=None) - timedelta(days=rng.random())
+        ),
+    }
+    return row, rng
+
+
+def _emotions(user_id: uuid.UUID, rng: random.Random, start: datetime, days: int) -> Iterator[dict]:
+    """Generate a user's emotions as a two-state (active/inactive) day chain."""
+    profile = rng.choices(list(PROFILES), [weight for weight, *_ in PROFILES.values()])[0]
+    _, keep_active, become_active, per_day = PROFILES[profile]
+    active = rng.random() < become_active
+    for day in range(days):
+        active = rng.random() < (keep_active if active else become_active)
+        if not active:
+            continue
+        midnight = datetime.combine(start.date() + timedelta(days=day), day_time(), COLOMBIA_TZ)
+        for _ in range(rng.randint(1, per_day)):
+            yield {
+                "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+                "user_id": user_id,
+                "title": rng.choice(TITLES),
+                "text": " ".join(rng.sample(PHRASES, rng.randint(1, 4))),
+                "ai_response": rng.choice(AI_RESPONSES),
+                "created_at": midnight + timedelta(seconds=rng.randint(6 * 3600, 24 * 3600 - 1)),
+            }
+
+
+def _rows(
+    kind: str,
+    seed: int,
+    indexes: range,
+    hashed_password: str,
+    start: datetime,
+    days: int
+) -> Iterator[tuple]:
+    """Rows of one table for a range of user indexes, in table column order."""
+    for index in indexes:
+        user, rng = _user(seed, index, hashed_password, start)
+        if kind == "users":
+            yield tuple(user[column] for column in USER_COLUMNS)
+        else:
+            for emotion in _emotions(user["id"], rng, start, days):
+                yield tuple(emotion[column] for column in EMOTION_COLUMNS)
+
+
+async def _copy(kind: str, rows: Iterator[tuple]) -> int:
+    """COPY rows into a table in chunks; returns the number of rows."""
+    table, columns = ("users", USER_COLUMNS) if kind == "users" else ("emotions", EMOTION_COLUMNS)
+    connection = await asyncpg.connect(_dsn())
+    total = 0
+    try:
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= COPY_CHUNK_SIZE:
+                await connection.copy_records_to_table(table, records=chunk, columns=columns)
+                total += len(chunk)
+                chunk = []
+        if chunk:
+            await connection.copy_records_to_table(table, records=chunk, columns=columns)
+            total += len(chunk)
+    finally:
+        await connection.close()
+    return total
+
+
+async def _create_partitions(start: datetime, end: datetime) -> int:
+    """Create the monthly emotions partitions the dataset spans."""
+    months = (end.year - start.year) * 12 + end.month - start.month + 1
+    connection = await asyncpg.connect(_dsn())
+    try:
+        return await connection.fetchval(
+            "SELECT create_emotion_partitions('emotions', $1, $2)", start.date(), months
+        )
+    finally:
+        await connection.close()
+
+
+def load_shard(
+    kind: str,
+    seed: int,
+    indexes: range,
+    hashed_password: str,
+    start: datetime,
+    days: int
+) -> int:
+    """Worker entry point: generate and copy one shard of a table."""
+    load_dotenv()
+    return asyncio.run(_copy(kind, _rows(kind, seed, indexes, hashed_password, start, days)))
+
+
+async def _finish() -> tuple[int, int]:
+    """Rebuild read models and refresh planner statistics."""
+    from common.infrastructure.database.session import async_session_scope, dispose_engines
+    from emotions.infrastructure.database.daily_count_repository import EmotionDailyCountRepository
+    from emotions.infrastructure.database.user_streak_repository import UserStreakRepository
+    
+    try:
+        async with async_session_scope() as session:
+            streaks = await UserStreakRepository(session).rebuild()
+            daily_counts = await EmotionDailyCountRepository(session).rebuild()
+    finally:
+        await dispose_engines()
+    
+    connection = await asyncpg.connect(_dsn())
+    try:
+        await connection.execute("ANALYZE users, emotions, user_streaks, emotion_daily_counts")
+    finally:
+        await connection.close()
+    return streaks, daily_counts
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Bulk dataset seeder")
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--days", type=int, default=365, help="History length, ending yesterday")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Parallel COPY processes"
+    )
+    parser.add_argument(
+        "--password", default="benchmark-password", help="Password of every seeded user"
+    )
+    args = parser.parse_args()
+    
+    load_dotenv()
+    # Fixed at midnight so the dataset only depends on the seed and the day it runs
+    today = colombia_now().replace(hour=0, minute=0, second=0, microsecond=0)
+    start = today - timedelta(days=args.days)
+    hashed_password = HashedPassword.from_plain(args.password).value
+    
+    shards = max(1, args.workers * 4)
+    step = -(-args.users // shards)
+    ranges = [range(first, min(first + step, args.users)) for first in range(0, args.users, step)]
+    
+    # Otherwise history before the migration's partitions lands in the default one
+    asyncio.run(_create_partitions(start, today))
+    
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for kind in ("users", "emotions"):
+            started = time.perf_counter()
+            futures = [
+                executor.submit(
+                    load_shard, kind, args.seed, indexes, hashed_password, start, args.days
+                )
+                for indexes in ranges
+            ]
+            count = sum(future.result() for future in futures)
+            elapsed = time.perf_counter() - started
+            print(f"Copied {count} {kind} in {elapsed:.1f}s ({count / elapsed:,.0f} rows/s)")
+    
+    started = time.perf_counter()
+    streaks, daily_counts = asyncio.run(_finish())
+    print(
+        f"Rebuilt {streaks} streak rows and {daily_counts} daily count rows, "
+        f"analyzed in {time.perf_counter() - started:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
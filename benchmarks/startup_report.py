@@ -0,0 +1,130 @@
+"""Startup timing report for the API entry point.
+
+Shows where cold-start time goes: per-module import time (via
+``python -X importtime`` in a fresh interpreter) and per-model pydantic
+schema build time.
+
+Usage:
+    python -m benchmarks.startup_report [--top 25] [--json report.json]
+"""
+
+import argparse
+import inspect
+import json
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from pydantic import BaseModel
+
+ENTRY_MODULE = "api.index"
+
+# First-party packages whose pydantic models are timed
+APP_PACKAGES = ("api", "auth", "common", "emotions")
+
+
+def measure_imports(module: str = ENTRY_MODULE) -> dict:
+    """Import module in a fresh interpreter and parse -X importtime output.
+    
+    Returns:
+        Total wall time, per-module self/cumulative microseconds and
+        cumulative time grouped by top-level package
+    """
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True
+    )
+    wall = time.perf_counter() - started
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{completed.stderr}")
+    
+    modules = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append({
+            "module": name.strip(),
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+            # importtime indents nested imports by two spaces per level
+            "depth": (len(name) - len(name.lstrip()) - 1) // 2
+        })
+    
+    packages = defaultdict(int)
+    for entry in modules:
+        packages[entry["module"].split(".")[0]] += entry["self_us"]
+    
+    return {
+        "process_wall_seconds": wall,
+        "total_import_us": sum(entry["self_us"] for entry in modules),
+        "packages": dict(sorted(packages.items(), key=lambda item: -item[1])),
+        "modules": sorted(modules, key=lambda entry: -entry["self_us"])
+    }
+
+
+def measure_models() -> list[dict]:
+    """Time a forced schema rebuild for every first-party pydantic model."""
+    __import__(ENTRY_MODULE)
+    
+    seen = set()
+    pending = list(BaseModel.__subclasses__())
+    models = []
+    while pending:
+        model = pending.pop()
+        if model in seen:
+            continue
+        seen.add(model)
+        pending.extend(model.__subclasses__())
+        if model.__module__.split(".")[0] in APP_PACKAGES and not inspect.isabstract(model):
+            models.append(model)
+    
+    timings = []
+    for model in models:
+        started = time.perf_counter()
+        model.model_rebuild(force=True)
+        timings.append({
+            "model": f"{model.__module__}.{model.__qualname__}",
+            "schema_build_us": int((time.perf_counter() - started) * 1_000_000)
+        })
+    return sorted(timings, key=lambda entry: -entry["schema_build_us"])
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Startup timing report")
+    parser.add_argument("--top", type=int, default=25, help="Modules to list")
+    parser.add_argument("--json", dest="json_path", help="Also write full report to this file")
+    args = parser.parse_args()
+    
+    imports = measure_imports()
+    models = measure_models()
+    
+    wall_ms = imports['process_wall_seconds'] * 1000
+    print(f"Interpreter + import of {ENTRY_MODULE}: {wall_ms:.1f} ms")
+    print(f"Total import time: {imports['total_import_us'] / 1000:.1f} ms\n")
+    
+    print("Import time by top-level package (self, ms)")
+    for package, self_us in list(imports["packages"].items())[:args.top]:
+        print(f"  {self_us / 1000:9.2f}  {package}")
+    
+    print(f"\nSlowest {args.top} modules (self / cumulative, ms)")
+    for entry in imports["modules"][:args.top]:
+        self_ms = entry['self_us'] / 1000
+        cumulative_ms = entry['cumulative_us'] / 1000
+        print(f"  {self_ms:9.2f} {cumulative_ms:9.2f}  {entry['module']}")
+    
+    print("\nPydantic schema build per model (ms)")
+    for entry in models:
+        print(f"  {entry['schema_build_us'] / 1000:9.2f}  {entry['model']}")
+    
+    if args.json_path:
+        with open(args.json_path, "w") as report:
+            json.dump({"imports": imports, "models": models}, report, indent=2)
+
+
+if __name__ == "__main__":
+    main()
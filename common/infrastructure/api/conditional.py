@@ -0,0 +1,87 @@
+"""Conditional GET helpers (ETag / If-None-Match)."""
+
+import hashlib
+from typing import Awaitable, Callable
+from uuid import UUID
+
+from fastapi import Response, status
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from common.infrastructure.api.responses import DTOResponse
+from common.infrastructure.cache.read_cache import get_read_cache
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag for a representation identified by parts.
+    
+    Parts must include everything the response body depends on: a version
+    of the underlying data plus every query parameter that shapes it.
+    """
+    digest = hashlib.blake2b(
+        "\x1f".join(str(part) for part in parts).encode('utf-8'),
+        digest_size=16
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header value matches etag."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    return "*" in candidates or etag in (candidate.removeprefix("W/") for candidate in candidates)
+
+
+def etag_headers(etag: str) -> dict[str, str]:
+    """Headers sent with both 200 and 304 responses.
+    
+    no-cache lets clients store the response but makes them revalidate it
+    with If-None-Match on every use.
+    """
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def not_modified(etag: str) -> Response:
+    """304 Not Modified response for etag."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag))
+
+
+async def conditional_read(
+    user_id: UUID,
+    cache_key: str,
+    if_none_match: str | None,
+    compute_etag: Callable[[], Awaitable[str]],
+    load: Callable[[], Awaitable[BaseModel]]
+) -> Response:
+    """Serve a user's read with ETag support, through the read cache.
+    
+    With a cache, the ETag and JSON body are cached together, so hits
+    (200 or 304) never reach the database. Without one, the ETag is
+    computed first and a match returns 304 before anything is loaded.
+    
+    Args:
+        user_id: Owner of the data (cache namespace)
+        cache_key: Identifies the response within the user's namespace;
+            must include every parameter the response depends on
+        if_none_match: Request's If-None-Match header
+        compute_etag: Returns the ETag; called before load
+        load: Returns the response DTO
+    """
+    cache = get_read_cache()
+    if not cache.enabled:
+        etag = await compute_etag()
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        return DTOResponse(await load(), headers=etag_headers(etag))
+    
+    async def render() -> bytes:
+        etag = await compute_etag()
+        return etag.encode() + b"\n" + to_json(await load())
+    
+    etag, _, body = (await cache.get_or_load(user_id, cache_key, render)).partition(b"\n")
+    etag = etag.decode()
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return Response(body, media_type="application/json", headers=etag_headers(etag))
@@ -0,0 +1,21 @@
+"""Response classes for serializing DTOs without a second validation pass."""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class DTOResponse(JSONResponse):
+    """JSON response serialized directly by pydantic-core.
+    
+    Returning an instance from an endpoint makes FastAPI skip its
+    response_model handling (dump to dict, re-validate, encode, json.dumps):
+    the DTO is written to JSON bytes in one Rust pass. The route's
+    response_model is still used for the OpenAPI schema, so the content
+    must be the DTO (or list of DTOs) that response_model declares.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        """Serialize pydantic models, dataclasses and plain values to JSON."""
+        return to_json(content)
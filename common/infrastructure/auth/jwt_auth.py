@@ -7,7 +7,8 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel
 
-from auth.application.services.jwt_service import JWTService
+from auth.application.services.jwt_service import get_jwt_service
+from common.infrastructure.auth.token_cache import get_token_cache
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
@@ -18,13 +19,20 @@ class CurrentUser(BaseModel):
     
     id: UUID
     email: str
+    
+    class Config:
+        """Pydantic configuration."""
+        frozen = True
 
 
-def get_current_user(
+async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)]
 ) -> CurrentUser:
     """Extract and validate current user from JWT token.
     
+    Verified tokens are cached until their expiry, so repeat requests with
+    the same token skip signature verification.
+    
     Args:
         credentials: HTTP Bearer credentials from request header
         
@@ -36,9 +44,15 @@ def get_current_user(
     """
     token = credentials.credentials
     
+    # Serve already verified tokens from cache
+    token_cache = get_token_cache()
+    cache_key = token_cache.key(token)
+    current_user = token_cache.get(cache_key)
+    if current_user is not None:
+        return current_user
+    
     # Validate token
-    jwt_service = JWTService()
-    payload = jwt_service.validate_token(token)
+    payload = get_jwt_service().validate_token(token)
     
     if not payload:
         raise HTTPException(
@@ -55,7 +69,10 @@ def get_current_user(
         if not user_id or not email:
             raise ValueError("Missing user info in token")
             
-        return CurrentUser(id=user_id, email=email)
+        current_user = CurrentUser(id=user_id, email=email)
+        if "exp" in payload:
+            token_cache.put(cache_key, current_user, payload["exp"])
+        return current_user
     except (ValueError, KeyError) as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
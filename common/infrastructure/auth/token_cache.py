@@ -0,0 +1,78 @@
+"""In-process cache of verified JWTs."""
+
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any
+
+
+class TokenCache:
+    """Bounded LRU of decoded tokens keyed by SHA-256 digest.
+    
+    Entries are dropped once the token's ``exp`` has passed, so a cached
+    token is never accepted for longer than the JWT itself allows. Raw
+    tokens are never stored. Meant to be used from the event loop thread.
+    """
+    
+    def __init__(self, max_size: int):
+        """Initialize with maximum number of entries (0 disables caching)."""
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def key(token: str) -> bytes:
+        """Cache key for a raw token."""
+        return hashlib.sha256(token.encode('utf-8')).digest()
+    
+    def get(self, key: bytes) -> Any | None:
+        """Get cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        expires_at, value = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def put(self, key: bytes, value: Any, expires_at: float) -> None:
+        """Cache value until expires_at (Unix timestamp)."""
+        if self.max_size <= 0:
+            return
+        
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+    
+    def stats(self) -> dict:
+        """Snapshot of size and hit/miss counters."""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_token_cache() -> TokenCache:
+    """Get the process-wide token cache sized from JWT_CACHE_SIZE."""
+    return TokenCache(max_size=int(os.getenv("JWT_CACHE_SIZE", "10000")))
@@ -0,0 +1 @@
+"""Read caching."""
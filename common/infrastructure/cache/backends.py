@@ -0,0 +1,199 @@
+"""Read cache storage backends.
+
+Entries are namespaced per user. Every lookup returns a generation token
+taken before the caller loads from the database; set() stores the entry
+under that token, and entries whose token no longer matches the user's
+current generation are treated as misses. Bumping the generation therefore
+invalidates a user's entries, including fills that were already in flight
+when the write committed.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Protocol
+from uuid import UUID
+
+
+class CacheBackend(Protocol):
+    """Storage for per-user cache entries."""
+    
+    name: str
+    
+    async def get(self, user_id: UUID, key: str) -> tuple[str, bytes | None]:
+        """Current generation token and the entry, or None when missing or stale."""
+    
+    async def set(self, user_id: UUID, key: str, token: str, value: bytes) -> None:
+        """Store an entry computed after get() returned token."""
+    
+    async def invalidate(self, user_id: UUID) -> None:
+        """Invalidate all of a user's entries."""
+    
+    async def clear(self) -> None:
+        """Invalidate every entry."""
+    
+    def stats(self) -> dict:
+        """Backend-specific counters."""
+
+
+class MemoryCacheBackend:
+    """In-process LRU with a TTL per entry.
+    
+    Only correct with a single process: invalidations are not seen by other
+    workers or instances, which serve stale entries until they expire.
+    """
+    
+    name = "memory"
+    
+    def __init__(self, max_size: int, ttl: float):
+        """Initialize with maximum number of entries and their lifetime in seconds."""
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[UUID, str], tuple[float, bytes]] = OrderedDict()
+        self._keys_by_user: dict[UUID, set[str]] = {}
+        self._generations: dict[UUID, int] = {}
+        self._epoch = 0
+        self.evictions = 0
+    
+    def _token(self, user_id: UUID) -> str:
+        """Generation token of a user."""
+        return f"{self._epoch}.{self._generations.get(user_id, 0)}"
+    
+    async def get(self, user_id: UUID, key: str) -> tuple[str, bytes | None]:
+        """Current token and unexpired entry."""
+        token = self._token(user_id)
+        entry = self._entries.get((user_id, key))
+        if entry is None:
+            return token, None
+        
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._remove((user_id, key))
+            return token, None
+        
+        self._entries.move_to_end((user_id, key))
+        return token, value
+    
+    async def set(self, user_id: UUID, key: str, token: str, value: bytes) -> None:
+        """Store entry unless the user was invalidated since token was issued."""
+        if self.max_size <= 0 or token != self._token(user_id):
+            return
+        
+        self._entries[(user_id, key)] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end((user_id, key))
+        self._keys_by_user.setdefault(user_id, set()).add(key)
+        while len(self._entries) > self.max_size:
+            oldest, _ = next(iter(self._entries.items()))
+            self._remove(oldest)
+            self.evictions += 1
+    
+    async def invalidate(self, user_id: UUID) -> None:
+        """Drop the user's entries and bump their generation."""
+        for key in self._keys_by_user.pop(user_id, ()):
+            self._entries.pop((user_id, key), None)
+        self._generations[user_id] = self._generations.get(user_id, 0) + 1
+        # Generations only need to outlive in-flight fills; bound them
+        if len(self._generations) > self.max_size:
+            await self.clear()
+    
+    async def clear(self) -> None:
+        """Drop everything; the new epoch rejects in-flight fills."""
+        self._entries.clear()
+        self._keys_by_user.clear()
+        self._generations.clear()
+        self._epoch += 1
+    
+    def stats(self) -> dict:
+        """Size and eviction counters."""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "evictions": self.evictions,
+        }
+    
+    def _remove(self, entry_key: tuple[UUID, str]) -> None:
+        """Remove one entry and its index record."""
+        del self._entries[entry_key]
+        user_id, key = entry_key
+        keys = self._keys_by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user_id]
+
+
+class RedisCacheBackend:
+    """Shared cache on any Redis-protocol server (Redis, Valkey, KeyDB, ...).
+    
+    A lookup is one MGET of the global generation, the user's generation
+    and the entry; entries embed the token they were computed under.
+    Generation keys outlive entries (2x TTL), so a generation can only reset
+    once every entry that referenced it has expired.
+    """
+    
+    name = "redis"
+    
+    def __init__(self, client, ttl: float, prefix: str = "emotions:cache"):
+        """Initialize with a redis.asyncio client and entry lifetime in seconds."""
+        self.client = client
+        self.ttl = max(1, int(ttl))
+        self.prefix = prefix
+    
+    @classmethod
+    def from_url(cls, url: str, ttl: float) -> "RedisCacheBackend":
+        """Create backend from a redis:// URL (requires the redis package)."""
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError(
+                "READ_CACHE_BACKEND=redis requires the 'redis' package (pip install redis)"
+            ) from e
+        return cls(redis.from_url(url), ttl)
+    
+    def _global_key(self) -> str:
+        """Key of the global generation."""
+        return f"{self.prefix}:gen"
+    
+    def _user_key(self, user_id: UUID) -> str:
+        """Key of a user's generation."""
+        return f"{self.prefix}:{user_id}:gen"
+    
+    def _entry_key(self, user_id: UUID, key: str) -> str:
+        """Key of one entry."""
+        return f"{self.prefix}:{user_id}:{key}"
+    
+    async def get(self, user_id: UUID, key: str) -> tuple[str, bytes | None]:
+        """Current token and entry, in one round trip."""
+        global_gen, user_gen, entry = await self.client.mget(
+            self._global_key(), self._user_key(user_id), self._entry_key(user_id, key)
+        )
+        token = f"{int(global_gen or 0)}.{int(user_gen or 0)}"
+        if entry is None:
+            return token, None
+        
+        entry_token, _, value = entry.partition(b"|")
+        if entry_token.decode() != token:
+            return token, None
+        return token, value
+    
+    async def set(self, user_id: UUID, key: str, token: str, value: bytes) -> None:
+        """Store entry tagged with token."""
+        await self.client.set(
+            self._entry_key(user_id, key),
+            token.encode() + b"|" + value,
+            ex=self.ttl
+        )
+    
+    async def invalidate(self, user_id: UUID) -> None:
+        """Bump the user's generation."""
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.incr(self._user_key(user_id))
+            pipe.expire(self._user_key(user_id), self.ttl * 2)
+            await pipe.execute()
+    
+    async def clear(self) -> None:
+        """Bump the global generation."""
+        await self.client.incr(self._global_key())
+    
+    def stats(self) -> dict:
+        """No local counters; use the server's INFO for memory and keys."""
+        return {}
@@ -0,0 +1,134 @@
+"""Per-user read cache with single-flight loading."""
+
+import asyncio
+import logging
+import os
+from functools import lru_cache
+from typing import Awaitable, Callable
+from uuid import UUID
+
+from common.infrastructure.cache.backends import CacheBackend, MemoryCacheBackend, RedisCacheBackend
+
+logger = logging.getLogger(__name__)
+
+# READ_CACHE_BACKEND values
+CACHE_BACKENDS = ("none", "memory", "redis")
+
+
+class ReadCache:
+    """Cache of serialized read responses, keyed per user.
+    
+    Concurrent misses for the same key share one load (single flight), so
+    an expired popular entry triggers one database query, not one per
+    waiting request. Backend failures are logged and fall through to the
+    loader: the cache never makes a read fail.
+    """
+    
+    def __init__(self, backend: CacheBackend | None):
+        """Initialize with a backend; None disables caching."""
+        self.backend = backend
+        self._flights: dict[tuple[UUID, str], asyncio.Future] = {}
+        
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether a backend is configured."""
+        return self.backend is not None
+    
+    async def get_or_load(
+        self,
+        user_id: UUID,
+        key: str,
+        loader: Callable[[], Awaitable[bytes]]
+    ) -> bytes:
+        """Return the cached value, or load, store and return it."""
+        if self.backend is None:
+            return await loader()
+        
+        token = None
+        try:
+            token, value = await self.backend.get(user_id, key)
+        except Exception:
+            self.errors += 1
+            logger.warning("Read cache lookup failed", exc_info=True)
+            value = None
+        if value is not None:
+            self.hits += 1
+            return value
+        self.misses += 1
+        
+        flight_key = (user_id, key)
+        flight = self._flights.get(flight_key)
+        if flight is not None:
+            self.coalesced += 1
+            value = await asyncio.shield(flight)
+            # None means the leading load failed; load on our own
+            return value if value is not None else await loader()
+        
+        flight = self._flights[flight_key] = asyncio.get_running_loop().create_future()
+        value = None
+        try:
+            value = await loader()
+            if token is not None:
+                try:
+                    await self.backend.set(user_id, key, token, value)
+                except Exception:
+                    self.errors += 1
+                    logger.warning("Read cache store failed", exc_info=True)
+            return value
+        finally:
+            del self._flights[flight_key]
+            flight.set_result(value)
+    
+    async def invalidate_user(self, user_id: UUID) -> None:
+        """Invalidate a user's entries after their data changed."""
+        if self.backend is None:
+            return
+        try:
+            await self.backend.invalidate(user_id)
+        except Exception:
+            self.errors += 1
+            logger.error("Read cache invalidation failed for user %s", user_id, exc_info=True)
+    
+    async def invalidate_all(self) -> None:
+        """Invalidate every entry, e.g. after a full rebuild."""
+        if self.backend is None:
+            return
+        try:
+            await self.backend.clear()
+        except Exception:
+            self.errors += 1
+            logger.error("Read cache clear failed", exc_info=True)
+    
+    def stats(self) -> dict:
+        """Snapshot of hit/miss counters."""
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend.name if self.backend else "none",
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            **(self.backend.stats() if self.backend else {}),
+        }
+
+
+@lru_cache(maxsize=1)
+def get_read_cache() -> ReadCache:
+    """Get the process-wide read cache configured from environment variables."""
+    name = os.getenv("READ_CACHE_BACKEND", "none")
+    ttl = float(os.getenv("READ_CACHE_TTL", "300"))
+    if name == "none":
+        return ReadCache(None)
+    if name == "memory":
+        return ReadCache(MemoryCacheBackend(int(os.getenv("READ_CACHE_SIZE", "10000")), ttl))
+    if name == "redis":
+        url = os.getenv("READ_CACHE_REDIS_URL", "redis://localhost:6379/0")
+        return ReadCache(RedisCacheBackend.from_url(url, ttl))
+    raise ValueError(f"READ_CACHE_BACKEND must be one of {', '.join(CACHE_BACKENDS)}, got '{name}'")
@@ -1,30 +1,249 @@
 """Database session management."""
 
+import logging
 import os
-from typing import Generator
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, Awaitable, Callable, Generator
+from uuid import uuid4
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+
+from common.infrastructure.observability.query_stats import record_query
+
+ASYNC_DRIVERNAME = "postgresql+asyncpg"
+SYNC_DRIVERNAME = "postgresql+psycopg2"
+
+logger = logging.getLogger(__name__)
+
+# DATABASE_POOL_MODE values
+POOL_MODES = ("queue", "null", "pgbouncer-transaction")
 
 # Lazy engine initialization
 _engine = None
 _SessionLocal = None
+_async_engine = None
+_AsyncSessionLocal = None
+_pool_mode = None
+
+
+def _get_database_url() -> str:
+    """Read DATABASE_URL from the environment."""
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise ValueError("DATABASE_URL environment variable is not set")
+    return database_url
+
+
+def to_async_url(database_url: str) -> URL:
+    """Normalize a PostgreSQL URL to use the asyncpg driver.
+    
+    Accepts plain ``postgres://``/``postgresql://`` URLs as well as
+    psycopg2 ones, translating libpq's ``sslmode`` into asyncpg's ``ssl``.
+    """
+    url = make_url(database_url)
+    query = dict(url.query)
+    if "sslmode" in query:
+        query["ssl"] = query.pop("sslmode")
+    return url.set(drivername=ASYNC_DRIVERNAME, query=query)
+
+
+def to_sync_url(database_url: str) -> URL:
+    """Normalize a PostgreSQL URL to use the psycopg2 driver."""
+    url = make_url(database_url)
+    query = dict(url.query)
+    if "ssl" in query:
+        query["sslmode"] = query.pop("ssl")
+    return url.set(drivername=SYNC_DRIVERNAME, query=query)
+
+
+class _TimedPoolMixin:
+    """Record how long callers wait to obtain a connection from the pool."""
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize pool and wait counters."""
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+    
+    def _do_get(self):
+        """Get a connection, timing how long it took."""
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            elapsed = time.perf_counter() - started
+            self.checkouts += 1
+            self.wait_seconds_total += elapsed
+            self.wait_seconds_max = max(self.wait_seconds_max, elapsed)
+
+
+class TimedAsyncQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    """Async queue pool with checkout wait timing."""
+
+
+class TimedNullPool(_TimedPoolMixin, NullPool):
+    """Non-pooling pool with connect wait timing."""
+
+
+def _env_flag(name: str, default: str) -> bool:
+    """Read a boolean environment variable."""
+    return os.getenv(name, default).strip().lower() in ("1", "true", "yes", "on")
+
+
+def _pool_options(mode: str) -> dict:
+    """Engine keyword arguments for a DATABASE_POOL_MODE.
+    
+    - queue: long-running servers; a persistent pool sized by env.
+    - null: serverless or an external pooler; one connection per checkout.
+    - pgbouncer-transaction: like null, and also disables prepared statement
+      caching, which breaks when PgBouncer reassigns server connections.
+    """
+    if mode == "queue":
+        return {
+            "poolclass": TimedAsyncQueuePool,
+            "pool_size": int(os.getenv("DATABASE_POOL_SIZE", "5")),
+            "max_overflow": int(os.getenv("DATABASE_MAX_OVERFLOW", "10")),
+            "pool_timeout": float(os.getenv("DATABASE_POOL_TIMEOUT", "30")),
+            "pool_recycle": int(os.getenv("DATABASE_POOL_RECYCLE", "1800")),
+            "pool_pre_ping": _env_flag("DATABASE_POOL_PRE_PING", "true")
+        }
+    if mode == "null":
+        return {"poolclass": TimedNullPool}
+    if mode == "pgbouncer-transaction":
+        return {
+            "poolclass": TimedNullPool,
+            "connect_args": {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                # Unique names so statements never collide on a shared server connection
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__"
+            }
+        }
+    raise ValueError(f"DATABASE_POOL_MODE must be one of {', '.join(POOL_MODES)}, got '{mode}'")
+
+
+def _install_query_events(engine: Engine) -> None:
+    """Time every statement, attribute it to the current request and log slow ones.
+    
+    Statements slower than SQL_SLOW_QUERY_MS (0 disables) are logged as
+    warnings. With SQL_SLOW_QUERY_EXPLAIN, the estimated plan of slow
+    queries is logged, fetched with plain EXPLAIN on the same connection.
+    ANALYZE is not used: it would execute the statement a second time, and
+    even a SELECT may have side effects (e.g. SELECT set_config(...)).
+    """
+    slow_seconds = float(os.getenv("SQL_SLOW_QUERY_MS", "0")) / 1000
+    explain = _env_flag("SQL_SLOW_QUERY_EXPLAIN", "false")
+    
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+    
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        record_query(statement, elapsed)
+        
+        if not slow_seconds or elapsed < slow_seconds:
+            return
+        logger.warning("Slow query (%.1f ms): %s", elapsed * 1000, statement)
+        
+        streaming = context is not None and context.execution_options.get("stream_results")
+        if explain and not executemany and not streaming and _is_explainable(statement):
+            _log_query_plan(conn, statement, parameters)
+
+
+# Statements EXPLAIN accepts; utility statements (SET, LOCK, ...) have no plan
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+
+def _is_explainable(statement: str) -> bool:
+    """Whether a statement has a plan EXPLAIN can show."""
+    return statement.lstrip().upper().startswith(_EXPLAINABLE)
+
+
+def _log_query_plan(conn, statement: str, parameters) -> None:
+    """Log the estimated plan (EXPLAIN, never executing) of a statement."""
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN {statement}", parameters)
+        plan = "\n".join(row[0] for row in cursor.fetchall())
+        logger.warning("Query plan:\n%s", plan)
+    except Exception:
+        logger.exception("Could not capture query plan")
+    finally:
+        cursor.close()
 
 
 def get_engine():
-    """Get or create database engine."""
+    """Get or create sync database engine (migrations and scripts)."""
     global _engine, _SessionLocal
     if _engine is None:
-        database_url = os.getenv("DATABASE_URL")
-        if not database_url:
-            raise ValueError("DATABASE_URL environment variable is not set")
-        _engine = create_engine(database_url, echo=False)
+        _engine = create_engine(to_sync_url(_get_database_url()), echo=False)
+        _install_query_events(_engine)
         _SessionLocal = sessionmaker(bind=_engine, autocommit=False, autoflush=False)
     return _engine, _SessionLocal
 
 
+def get_async_engine():
+    """Get or create async database engine."""
+    global _async_engine, _AsyncSessionLocal, _pool_mode
+    if _async_engine is None:
+        _pool_mode = os.getenv("DATABASE_POOL_MODE", "queue")
+        _async_engine = create_async_engine(
+            to_async_url(_get_database_url()),
+            echo=False,
+            **_pool_options(_pool_mode)
+        )
+        _install_query_events(_async_engine.sync_engine)
+        _AsyncSessionLocal = async_sessionmaker(
+            bind=_async_engine,
+            autoflush=False,
+            expire_on_commit=False
+        )
+    return _async_engine, _AsyncSessionLocal
+
+
+def get_pool_stats() -> dict | None:
+    """Connection pool statistics, or None before the engine is created."""
+    if _async_engine is None:
+        return None
+    
+    pool = _async_engine.pool
+    stats = {
+        "mode": _pool_mode,
+        "checkouts": pool.checkouts,
+        "wait_seconds_total": round(pool.wait_seconds_total, 6),
+        "wait_seconds_max": round(pool.wait_seconds_max, 6)
+    }
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow()
+        )
+    return stats
+
+
+async def dispose_engines() -> None:
+    """Close all pooled connections, e.g. on application shutdown."""
+    global _engine, _SessionLocal, _async_engine, _AsyncSessionLocal
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine, _AsyncSessionLocal = None, None
+    if _engine is not None:
+        _engine.dispose()
+        _engine, _SessionLocal = None, None
+
+
 def get_db_session() -> Generator[Session, None, None]:
-    """Get database session dependency for FastAPI."""
+    """Get sync database session."""
     _, SessionLocal = get_engine()
     session = SessionLocal()
     try:
@@ -35,3 +254,34 @@ def get_db_session() -> Generator[Session, None, None]:
         raise
     finally:
         session.close()
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """Run callback once the session's transaction has committed.
+    
+    Used for side effects that must not happen for rolled back work, such
+    as cache invalidation. Only honored by async_session_scope().
+    """
+    session.info.setdefault("after_commit", []).append(callback)
+
+
+@asynccontextmanager
+async def async_session_scope() -> AsyncIterator[AsyncSession]:
+    """Provide an async session that commits on success and rolls back on error."""
+    _, AsyncSessionLocal = get_async_engine()
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            session.info.pop("after_commit", None)
+            await session.rollback()
+            raise
+        for callback in session.info.pop("after_commit", ()):
+            await callback()
+
+
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get async database session dependency for FastAPI."""
+    async with async_session_scope() as session:
+        yield session
@@ -0,0 +1,169 @@
+"""Per-route request metrics in Prometheus text format."""
+
+from bisect import bisect_left
+from functools import lru_cache
+from time import perf_counter
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Histogram upper bounds in seconds; one extra slot holds +Inf
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0)
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RouteMetrics:
+    """Counters for one (method, route template) pair, allocated once."""
+    
+    __slots__ = ("method", "route", "bucket_counts", "status_counts", "duration_sum", "in_flight")
+    
+    def __init__(self, method: str, route: str):
+        """Initialize preallocated counters."""
+        self.method = method
+        self.route = route
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        # Indexed by status // 100 (1xx..5xx); slot 0 is unused
+        self.status_counts = [0] * 6
+        self.duration_sum = 0.0
+        self.in_flight = 0
+    
+    def observe(self, seconds: float, status_code: int) -> None:
+        """Record one finished request."""
+        self.bucket_counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.status_counts[min(status_code // 100, 5)] += 1
+        self.duration_sum += seconds
+
+
+class MetricsRegistry:
+    """All route metrics of the process."""
+    
+    def __init__(self):
+        """Initialize empty registry."""
+        self._routes: dict[tuple[str, str], RouteMetrics] = {}
+    
+    def route(self, method: str, route: str) -> RouteMetrics:
+        """Get metrics for a route, creating them on first use."""
+        key = (method, route)
+        metrics = self._routes.get(key)
+        if metrics is None:
+            metrics = self._routes[key] = RouteMetrics(method, route)
+        return metrics
+    
+    def render(self) -> str:
+        """Render all metrics in Prometheus text exposition format."""
+        lines = [
+            "# HELP http_requests_total Finished HTTP requests by route and status class.",
+            "# TYPE http_requests_total counter",
+        ]
+        routes = sorted(self._routes.values(), key=lambda metrics: (metrics.route, metrics.method))
+        for metrics in routes:
+            labels = f'method="{metrics.method}",route="{metrics.route}"'
+            for status_class in range(1, 6):
+                count = metrics.status_counts[status_class]
+                if count:
+                    lines.append(
+                        f'http_requests_total{{{labels},status="{status_class}xx"}} {count}'
+                    )
+        
+        lines += [
+            "# HELP http_requests_in_flight Requests currently being served.",
+            "# TYPE http_requests_in_flight gauge",
+        ]
+        for metrics in routes:
+            labels = f'method="{metrics.method}",route="{metrics.route}"'
+            lines.append(f"http_requests_in_flight{{{labels}}} {metrics.in_flight}")
+        
+        lines += [
+            "# HELP http_request_duration_seconds Request latency by route.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for metrics in routes:
+            labels = f'method="{metrics.method}",route="{metrics.route}"'
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, metrics.bucket_counts):
+                cumulative += count
+                lines.append(
+                    f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}'
+                )
+            cumulative += metrics.bucket_counts[-1]
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {cumulative}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {metrics.duration_sum}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {cumulative}")
+        
+        return "\n".join(lines) + "\n"
+
+
+def render_gauges(prefix: str, stats: dict | None) -> str:
+    """Render numeric values of a stats dict as Prometheus gauges."""
+    if not stats:
+        return ""
+    lines = []
+    for name, value in stats.items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            lines.append(f"# TYPE {prefix}_{name} gauge")
+            lines.append(f"{prefix}_{name} {value}")
+    return "\n".join(lines) + "\n"
+
+
+@lru_cache(maxsize=1)
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return MetricsRegistry()
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording count, status class, latency and in-flight per route.
+    
+    Requests are labelled with the matched route template (e.g.
+    ``/api/emotions/streak``), never the raw path, so label cardinality is
+    bounded by the number of routes.
+    """
+    
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry | None = None):
+        """Wrap app and resolve routes lazily on first request."""
+        self.app = app
+        self.registry = registry or get_metrics_registry()
+        self._templates: dict[tuple[str, str], str] = {}
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Time the request and record it under its route template."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        metrics = self.registry.route(scope["method"], self._route_template(scope))
+        status_code = 500
+        
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        metrics.in_flight += 1
+        started = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            metrics.in_flight -= 1
+            metrics.observe(perf_counter() - started, status_code)
+    
+    def _route_template(self, scope: Scope) -> str:
+        """Resolve the route template for a request, caching static paths."""
+        key = (scope["method"], scope["path"])
+        template = self._templates.get(key)
+        if template is not None:
+            return template
+        
+        partial = None
+        for route in scope["app"].router.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                if "{" not in route.path:
+                    self._templates[key] = route.path
+                return route.path
+            if match == Match.PARTIAL and partial is None:
+                partial = route.path
+        # Unmatched paths are not cached: they are unbounded (scanners, typos)
+        return partial or UNMATCHED_ROUTE
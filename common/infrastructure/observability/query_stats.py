@@ -0,0 +1,110 @@
+"""Per-request SQL statement accounting."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class QueryStats:
+    """Statements executed within one tracking scope.
+    
+    The SQL text is only kept when collect_statements is set, so tracking
+    every request costs two counters.
+    """
+    
+    __slots__ = ("count", "seconds", "statements", "parent")
+    
+    def __init__(self, parent: "QueryStats | None" = None, collect_statements: bool = False):
+        """Initialize empty counters, optionally rolling up into parent."""
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: list[str] | None = [] if collect_statements else None
+        self.parent = parent
+    
+    def record(self, statement: str, seconds: float) -> None:
+        """Record one executed statement here and in every enclosing scope."""
+        stats = self
+        while stats is not None:
+            stats.count += 1
+            stats.seconds += seconds
+            if stats.statements is not None:
+                stats.statements.append(statement)
+            stats = stats.parent
+    
+    def server_timing(self) -> str:
+        """Server-Timing header value for these statements."""
+        return f'db;dur={self.seconds * 1000:.2f};desc="{self.count} queries"'
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def record_query(statement: str, seconds: float) -> None:
+    """Attribute a statement to the current scope, if one is active."""
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, seconds)
+
+
+@contextmanager
+def track_queries(collect_statements: bool = False) -> Iterator[QueryStats]:
+    """Count statements executed in this context (and tasks it spawns)."""
+    stats = QueryStats(parent=_current_stats.get(), collect_statements=collect_statements)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def assert_query_budget(max_queries: int) -> Iterator[QueryStats]:
+    """Fail if the block issues more than max_queries statements.
+    
+    Requests must run in the caller's context for their statements to be
+    counted, e.g. through ``httpx.AsyncClient(transport=ASGITransport(app))``
+    rather than the thread-based TestClient::
+        
+        with assert_query_budget(2):
+            await client.get("/api/emotions/streak", headers=auth)
+    
+    Raises:
+        AssertionError: Listing the executed statements when over budget
+    """
+    with track_queries(collect_statements=True) as stats:
+        yield stats
+    if stats.count > max_queries:
+        statements = "\n".join(f"  {i}. {sql}" for i, sql in enumerate(stats.statements, 1))
+        raise AssertionError(
+            f"Expected at most {max_queries} queries, got {stats.count}:\n{statements}"
+        )
+
+
+class ServerTimingMiddleware:
+    """ASGI middleware reporting each request's DB statements via Server-Timing.
+    
+    Statements executed after the response headers are sent (streamed bodies,
+    dependency teardown) are not reflected in the header.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        """Wrap app."""
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Track the request's statements and add the header on response start."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        with track_queries() as stats:
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", stats.server_timing())
+                await send(message)
+            
+            await self.app(scope, receive, send_with_timing)
@@ -0,0 +1,51 @@
+"""Optional startup warmup for the API process."""
+
+import logging
+import os
+import time
+
+from fastapi import FastAPI
+from sqlalchemy import text
+
+from auth.application.services.jwt_service import get_jwt_service
+from common.infrastructure.database.session import get_async_engine
+
+logger = logging.getLogger(__name__)
+
+
+def warmup_enabled() -> bool:
+    """Whether WARMUP_ON_STARTUP is set."""
+    return os.getenv("WARMUP_ON_STARTUP", "false").strip().lower() in ("1", "true", "yes", "on")
+
+
+async def warmup(app: FastAPI) -> dict[str, float]:
+    """Do first-request work ahead of traffic.
+    
+    Opens a database connection (pool, TLS handshake, asyncpg type
+    introspection), builds the OpenAPI schema (finalizes every route's
+    pydantic models) and creates app-lifetime services.
+    
+    Returns:
+        Seconds spent per step
+    """
+    timings = {}
+    
+    started = time.perf_counter()
+    engine, _ = get_async_engine()
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+    timings["database"] = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    app.openapi()
+    timings["validators"] = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    get_jwt_service()
+    timings["services"] = time.perf_counter() - started
+    
+    logger.info(
+        "Warmup finished: %s",
+        ", ".join(f"{step}={seconds * 1000:.1f}ms" for step, seconds in timings.items())
+    )
+    return timings
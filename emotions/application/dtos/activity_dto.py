@@ -0,0 +1,29 @@
+"""Activity (calendar and stats) DTOs."""
+
+from datetime import date
+
+from pydantic import BaseModel, Field
+
+
+class CalendarDTO(BaseModel):
+    """Output DTO for a year heatmap."""
+    
+    year: int
+    total: int = Field(..., description="Emotions written in the year")
+    active_days: int = Field(..., description="Days with at least one emotion")
+    counts: list[int] = Field(..., description="Emotions per day; index 0 is January 1st")
+
+
+class ActivityBucketDTO(BaseModel):
+    """Emotions written in one period."""
+    
+    start: date = Field(..., description="First day of the period")
+    emotions: int
+    active_days: int
+
+
+class ActivityStatsDTO(BaseModel):
+    """Output DTO for emotions aggregated per period."""
+    
+    granularity: str
+    buckets: list[ActivityBucketDTO]
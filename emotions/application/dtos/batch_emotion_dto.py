@@ -0,0 +1,75 @@
+"""Batch emotion DTOs."""
+
+from datetime import datetime, timedelta
+from typing import Annotated, Any, Literal
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from pydantic import BaseModel, Field, WithJsonSchema, validator
+
+from emotions.application.dtos.create_emotion_dto import CreateEmotionDTO
+from emotions.application.dtos.emotion_dto import EmotionDTO
+
+COLOMBIA_TZ = ZoneInfo("America/Bogota")
+
+# Tolerated client clock skew for client-supplied timestamps
+MAX_CLOCK_SKEW = timedelta(minutes=5)
+
+
+class BatchEmotionItemDTO(CreateEmotionDTO):
+    """Input DTO for one emotion recorded offline."""
+    
+    id: UUID | None = Field(
+        None,
+        description="Client-generated ID; replays with the same ID are skipped"
+    )
+    created_at: datetime | None = Field(
+        None,
+        description="When the emotion was recorded; naive values are Colombia time"
+    )
+    
+    @validator('created_at')
+    def validate_created_at(cls, v):
+        """Attach Colombia timezone to naive values and reject future timestamps."""
+        if v is None:
+            return v
+        if v.tzinfo is None:
+            v = v.replace(tzinfo=COLOMBIA_TZ)
+        if v > datetime.now(COLOMBIA_TZ) + MAX_CLOCK_SKEW:
+            raise ValueError("created_at cannot be in the future")
+        return v
+
+
+_BatchItem = Annotated[dict[str, Any], WithJsonSchema(BatchEmotionItemDTO.model_json_schema())]
+
+
+class CreateEmotionBatchDTO(BaseModel):
+    """Input DTO for a batch of offline emotions.
+    
+    Items are validated one by one so a bad entry does not reject the batch;
+    they are accepted as plain objects but documented as BatchEmotionItemDTO.
+    """
+    
+    items: list[_BatchItem] = Field(
+        ...,
+        min_length=1,
+        description="BatchEmotionItemDTO objects, in the order they were recorded"
+    )
+
+
+class BatchEmotionResultDTO(BaseModel):
+    """Outcome for one batch item."""
+    
+    index: int
+    status: Literal["created", "duplicate", "invalid"]
+    emotion: EmotionDTO | None = None
+    error: str | None = None
+
+
+class EmotionBatchResultDTO(BaseModel):
+    """Output DTO for a batch, with one result per item in request order."""
+    
+    created: int
+    duplicates: int
+    invalid: int
+    results: list[BatchEmotionResultDTO]
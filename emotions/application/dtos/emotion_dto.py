@@ -3,7 +3,34 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, model_serializer
+
+# Fields a client may select with ?fields=; id and created_at are always returned
+SELECTABLE_FIELDS = frozenset({"title", "text", "ai_response"})
+ALWAYS_INCLUDED_FIELDS = frozenset({"id", "created_at"})
+
+
+def parse_fields(raw: str | None) -> frozenset[str] | None:
+    """Parse a comma-separated fields parameter.
+    
+    Returns:
+        The selected SELECTABLE_FIELDS, or None when raw is None (all fields)
+        
+    Raises:
+        ValueError: If a field is unknown
+    """
+    if raw is None:
+        return None
+    fields = frozenset(field.strip() for field in raw.split(",") if field.strip())
+    unknown = fields - SELECTABLE_FIELDS - ALWAYS_INCLUDED_FIELDS
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return fields & SELECTABLE_FIELDS
+
+
+def fields_key(fields: frozenset[str] | None) -> str:
+    """Canonical form of a field selection, for cache keys and ETags."""
+    return "*" if fields is None else ",".join(sorted(fields))
 
 
 class EmotionDTO(BaseModel):
@@ -14,3 +41,21 @@ class EmotionDTO(BaseModel):
     text: str
     ai_response: str
     created_at: datetime
+
+
+class PartialEmotionDTO(BaseModel):
+    """Output DTO for an emotion restricted to the fields a client selected.
+    
+    Fields that were not selected are left None and omitted from JSON.
+    """
+    
+    id: UUID
+    created_at: datetime
+    title: str | None = None
+    text: str | None = None
+    ai_response: str | None = None
+    
+    @model_serializer(mode="wrap")
+    def _omit_unselected(self, handler):
+        """Drop fields that were not selected."""
+        return {key: value for key, value in handler(self).items() if value is not None}
@@ -0,0 +1,12 @@
+"""Emotion page DTO."""
+
+from pydantic import BaseModel
+
+from emotions.application.dtos.emotion_dto import EmotionDTO, PartialEmotionDTO
+
+
+class EmotionPageDTO(BaseModel):
+    """Output DTO for one page of emotions."""
+    
+    items: list[EmotionDTO | PartialEmotionDTO]
+    next_cursor: str | None = None
@@ -0,0 +1,26 @@
+"""Emotion search DTOs."""
+
+from pydantic import BaseModel, Field
+
+from emotions.application.dtos.emotion_dto import EmotionDTO, PartialEmotionDTO
+
+
+class EmotionSearchResultDTO(EmotionDTO):
+    """One search hit: the emotion plus its relevance and a text snippet."""
+    
+    rank: float = Field(..., description="Relevance (ts_rank); higher is better")
+    snippet: str = Field(..., description="Fragment of text with matches wrapped in **")
+
+
+class PartialEmotionSearchResultDTO(PartialEmotionDTO):
+    """One search hit restricted to the fields a client selected."""
+    
+    rank: float = Field(..., description="Relevance (ts_rank); higher is better")
+    snippet: str = Field(..., description="Fragment of text with matches wrapped in **")
+
+
+class EmotionSearchPageDTO(BaseModel):
+    """Output DTO for one page of search results."""
+    
+    items: list[EmotionSearchResultDTO | PartialEmotionSearchResultDTO]
+    next_cursor: str | None = None
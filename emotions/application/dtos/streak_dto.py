@@ -10,4 +10,5 @@ class StreakDTO(BaseModel):
     
     has_emotion_today: bool
     current_streak: int
+    longest_streak: int = 0
     last_emotion_date: date | None = None
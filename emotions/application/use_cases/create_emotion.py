@@ -10,11 +10,23 @@ from emotions.domain.entities.emotion import Emotion
 class CreateEmotion:
     """Create emotion use case."""
     
-    def __init__(self, emotion_repository):
+    def __init__(self, emotion_repository, user_streak_repository, daily_count_repository):
         """Initialize with repositories."""
         self.emotion_repository = emotion_repository
+        self.user_streak_repository = user_streak_repository
+        self.daily_count_repository = daily_count_repository
     
-    def execute(self, user_id: UUID, data: CreateEmotionDTO) -> EmotionDTO:
+    @staticmethod
+    def build_emotion(user_id: UUID, data: CreateEmotionDTO) -> Emotion:
+        """Build a new emotion entity from validated input."""
+        return Emotion(
+            user_id=user_id,
+            title=data.title,
+            text=data.text,
+            ai_response=data.ai_response
+        )
+    
+    async def execute(self, user_id: UUID, data: CreateEmotionDTO) -> EmotionDTO:
         """Execute emotion creation.
         
         Args:
@@ -25,15 +37,15 @@ class CreateEmotion:
             EmotionDTO with created emotion
         """
         # Create emotion entity
-        emotion = Emotion(
-            user_id=user_id,
-            title=data.title,
-            text=data.text,
-            ai_response=data.ai_response
-        )
+        emotion = self.build_emotion(user_id, data)
         
         # Save emotion
-        created_emotion = self.emotion_repository.create(emotion)
+        created_emotion = await self.emotion_repository.create(emotion)
+        
+        # Update streak and daily counts read models in the same transaction
+        local_date = created_emotion.created_at.date()
+        await self.user_streak_repository.record_emotion_date(user_id, local_date)
+        await self.daily_count_repository.record_emotion_dates(user_id, [local_date])
         
         # Return DTO
         return EmotionDTO(
@@ -0,0 +1,121 @@
+"""Create emotion batch use case."""
+
+import os
+from dataclasses import replace
+from uuid import UUID
+
+from pydantic import ValidationError
+
+from emotions.application.dtos.batch_emotion_dto import (
+    BatchEmotionItemDTO,
+    BatchEmotionResultDTO,
+    CreateEmotionBatchDTO,
+    EmotionBatchResultDTO
+)
+from emotions.application.dtos.emotion_dto import EmotionDTO
+from emotions.application.use_cases.create_emotion import CreateEmotion
+
+
+def _format_errors(error: ValidationError) -> str:
+    """Compact one-line summary of a validation error."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'item'}: {err['msg']}"
+        for err in error.errors()
+    )
+
+
+class CreateEmotionBatch:
+    """Create many emotions recorded offline use case."""
+    
+    def __init__(self, emotion_repository, user_streak_repository, daily_count_repository):
+        """Initialize with repositories and batch size limit."""
+        self.emotion_repository = emotion_repository
+        self.user_streak_repository = user_streak_repository
+        self.daily_count_repository = daily_count_repository
+        self.max_size = int(os.getenv("EMOTIONS_BATCH_MAX_SIZE", "500"))
+    
+    async def execute(self, user_id: UUID, data: CreateEmotionBatchDTO) -> EmotionBatchResultDTO:
+        """Validate each item, then insert all valid ones in one statement.
+        
+        Args:
+            user_id: Current authenticated user ID
+            data: Raw batch items
+            
+        Returns:
+            EmotionBatchResultDTO with one result per item, in request order
+            
+        Raises:
+            ValueError: If the batch exceeds the configured maximum size
+        """
+        if len(data.items) > self.max_size:
+            raise ValueError(f"Batch cannot contain more than {self.max_size} items")
+        
+        results: list[BatchEmotionResultDTO | None] = [None] * len(data.items)
+        pending = []
+        seen_ids = set()
+        
+        # Validate each item with the same rules as a single create
+        for index, raw in enumerate(data.items):
+            try:
+                item = BatchEmotionItemDTO.model_validate(raw)
+            except ValidationError as e:
+                results[index] = BatchEmotionResultDTO(
+                    index=index,
+                    status="invalid",
+                    error=_format_errors(e)
+                )
+                continue
+            
+            emotion = CreateEmotion.build_emotion(user_id, item)
+            overrides = {
+                field: getattr(item, field)
+                for field in ("id", "created_at")
+                if getattr(item, field) is not None
+            }
+            if overrides:
+                emotion = replace(emotion, **overrides)
+            
+            if emotion.id in seen_ids:
+                results[index] = BatchEmotionResultDTO(index=index, status="duplicate")
+                continue
+            seen_ids.add(emotion.id)
+            pending.append((index, emotion))
+        
+        created = {
+            emotion.id: emotion
+            for emotion in await self.emotion_repository.create_many(
+                [emotion for _, emotion in pending]
+            )
+        }
+        
+        for index, emotion in pending:
+            saved = created.get(emotion.id)
+            if saved is None:
+                results[index] = BatchEmotionResultDTO(index=index, status="duplicate")
+                continue
+            results[index] = BatchEmotionResultDTO(
+                index=index,
+                status="created",
+                emotion=EmotionDTO(
+                    id=saved.id,
+                    title=saved.title,
+                    text=saved.text,
+                    ai_response=saved.ai_response,
+                    created_at=saved.created_at
+                )
+            )
+        
+        # Backdated entries can change any part of the streak, so recompute it
+        if created:
+            await self.user_streak_repository.rebuild(user_id)
+            await self.daily_count_repository.record_emotion_dates(
+                user_id,
+                [emotion.created_at.date() for emotion in created.values()]
+            )
+        
+        return EmotionBatchResultDTO(
+            created=sum(1 for result in results if result.status == "created"),
+            duplicates=sum(1 for result in results if result.status == "duplicate"),
+            invalid=sum(1 for result in results if result.status == "invalid"),
+            results=results
+        )
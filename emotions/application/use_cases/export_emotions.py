@@ -0,0 +1,47 @@
+"""Export emotions use case."""
+
+from typing import AsyncIterator
+from uuid import UUID
+
+from emotions.application.dtos.emotion_dto import EmotionDTO, PartialEmotionDTO
+
+
+class ExportEmotions:
+    """Export a user's full emotion history use case."""
+    
+    def __init__(self, emotion_repository):
+        """Initialize with repositories."""
+        self.emotion_repository = emotion_repository
+    
+    async def execute(
+        self,
+        user_id: UUID,
+        fields: frozenset[str] | None = None
+    ) -> AsyncIterator[EmotionDTO | PartialEmotionDTO]:
+        """Stream every emotion for user ordered by created_at desc.
+        
+        Args:
+            user_id: Current authenticated user ID
+            fields: Selected optional fields (see parse_fields); all when None
+            
+        Yields:
+            EmotionDTO, or PartialEmotionDTO when fields is given, for each
+            emotion (newest first)
+        """
+        emotions = self.emotion_repository.stream_all_by_user(user_id, fields=fields)
+        if fields is not None:
+            async for emotion in emotions:
+                yield PartialEmotionDTO(
+                    id=emotion.id,
+                    created_at=emotion.created_at,
+                    **{field: getattr(emotion, field) for field in fields}
+                )
+            return
+        async for emotion in emotions:
+            yield EmotionDTO(
+                id=emotion.id,
+                title=emotion.title,
+                text=emotion.text,
+                ai_response=emotion.ai_response,
+                created_at=emotion.created_at
+            )
@@ -0,0 +1,56 @@
+"""Get activity stats use case."""
+
+from datetime import date
+from uuid import UUID
+
+from emotions.application.dtos.activity_dto import ActivityBucketDTO, ActivityStatsDTO
+
+# Supported granularity values (PostgreSQL date_trunc units)
+GRANULARITIES = ("month", "year")
+
+
+class GetActivityStats:
+    """Emotions aggregated per month or year."""
+    
+    def __init__(self, daily_count_repository):
+        """Initialize with repositories."""
+        self.daily_count_repository = daily_count_repository
+    
+    async def execute(
+        self,
+        user_id: UUID,
+        granularity: str,
+        year: int | None = None
+    ) -> ActivityStatsDTO:
+        """Aggregate the user's emotions per period.
+        
+        Args:
+            user_id: Current authenticated user ID
+            granularity: One of GRANULARITIES
+            year: Restrict to one calendar year; whole history when None
+        
+        Returns:
+            ActivityStatsDTO with periods oldest first; empty periods omitted
+        
+        Raises:
+            ValueError: If granularity is not supported
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"granularity must be one of {', '.join(GRANULARITIES)}")
+        
+        start = end = None
+        if year is not None:
+            start, end = date(year, 1, 1), date(year + 1, 1, 1)
+        buckets = await self.daily_count_repository.get_buckets(user_id, granularity, start, end)
+        
+        return ActivityStatsDTO(
+            granularity=granularity,
+            buckets=[
+                ActivityBucketDTO(
+                    start=bucket.start,
+                    emotions=bucket.emotions,
+                    active_days=bucket.active_days
+                )
+                for bucket in buckets
+            ]
+        )
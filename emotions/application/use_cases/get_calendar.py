@@ -0,0 +1,39 @@
+"""Get calendar use case."""
+
+from datetime import date
+from uuid import UUID
+
+from emotions.application.dtos.activity_dto import CalendarDTO
+
+
+class GetCalendar:
+    """Emotions per day of a year, for a heatmap."""
+    
+    def __init__(self, daily_count_repository):
+        """Initialize with repositories."""
+        self.daily_count_repository = daily_count_repository
+    
+    async def execute(self, user_id: UUID, year: int) -> CalendarDTO:
+        """Build the user's calendar for a year.
+        
+        Args:
+            user_id: Current authenticated user ID
+            year: Calendar year (Colombia timezone dates)
+        
+        Returns:
+            CalendarDTO with one count per day of the year
+        """
+        start = date(year, 1, 1)
+        end = date(year + 1, 1, 1)
+        daily = await self.daily_count_repository.get_daily_counts(user_id, start, end)
+        
+        counts = [0] * (end - start).days
+        for emotion_date, count in daily.items():
+            counts[(emotion_date - start).days] = count
+        
+        return CalendarDTO(
+            year=year,
+            total=sum(daily.values()),
+            active_days=len(daily),
+            counts=counts
+        )
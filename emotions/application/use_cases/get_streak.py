@@ -1,6 +1,6 @@
 """Get streak use case."""
 
-from datetime import date, timedelta, datetime
+from datetime import datetime
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
@@ -12,13 +12,17 @@ COLOMBIA_TZ = ZoneInfo("America/Bogota")
 class GetStreak:
     """Get emotion streak for user."""
     
-    def __init__(self, emotion_repository):
-        """Initialize with repository."""
+    def __init__(self, user_streak_repository, emotion_repository):
+        """Initialize with repositories."""
+        self.user_streak_repository = user_streak_repository
         self.emotion_repository = emotion_repository
     
-    def execute(self, user_id: UUID) -> StreakDTO:
+    async def execute(self, user_id: UUID) -> StreakDTO:
         """Calculate user's emotion streak.
         
+        The streak counts back from today if the user already wrote today,
+        otherwise from yesterday.
+        
         Args:
             user_id: Current authenticated user ID
             
@@ -28,33 +32,14 @@ class GetStreak:
         # Get today's date in Colombia timezone
         today = datetime.now(COLOMBIA_TZ).date()
         
-        # Check if user has emotion today
-        has_today = self.emotion_repository.has_emotion_on_date(user_id, today)
-        
-        # Get all dates when user created emotions
-        emotion_dates = self.emotion_repository.get_emotion_dates_for_user(user_id)
-        
-        if not emotion_dates:
-            return StreakDTO(
-                has_emotion_today=False,
-                current_streak=0,
-                last_emotion_date=None
-            )
-        
-        # Calculate streak
-        current_streak = 0
-        check_date = today if has_today else today - timedelta(days=1)
-        
-        for emotion_date in emotion_dates:
-            if emotion_date == check_date:
-                current_streak += 1
-                check_date -= timedelta(days=1)
-            elif emotion_date < check_date:
-                # Gap found, streak broken
-                break
+        # Read model row; users not yet backfilled fall back to emotions
+        streak = await self.user_streak_repository.get_streak(user_id, today)
+        if streak is None:
+            streak = await self.emotion_repository.get_streak(user_id, today)
         
         return StreakDTO(
-            has_emotion_today=has_today,
-            current_streak=current_streak,
-            last_emotion_date=emotion_dates[0] if emotion_dates else None
+            has_emotion_today=streak.has_emotion_today,
+            current_streak=streak.current_streak,
+            longest_streak=streak.longest_streak,
+            last_emotion_date=streak.last_emotion_date
         )
@@ -15,7 +15,7 @@ class GetTodayEmotion:
         self.emotion_repository = emotion_repository
         self.user_repository = user_repository
     
-    def execute(self, user_id: UUID) -> EmotionDTO:
+    async def execute(self, user_id: UUID) -> EmotionDTO:
         """Get today's emotion for user.
         
         Args:
@@ -30,13 +30,13 @@ class GetTodayEmotion:
         today = date.today()
         
         # Find emotion for today
-        emotion = self.emotion_repository.find_by_user_and_date(user_id, today)
+        emotion = await self.emotion_repository.find_by_user_and_date(user_id, today)
         
         if not emotion:
             raise EmotionNotFound(str(user_id), str(today))
         
         # Get user info
-        user = self.user_repository.find_by_id(user_id)
+        user = await self.user_repository.find_by_id(user_id)
         user_name = user.name if user else "Unknown"
         
         # Return DTO
@@ -1,37 +1,90 @@
 """List emotions use case."""
 
+from datetime import date
 from uuid import UUID
 
-from emotions.application.dtos.emotion_dto import EmotionDTO
+from emotions.application.dtos.emotion_dto import EmotionDTO, PartialEmotionDTO
+from emotions.application.dtos.emotion_page_dto import EmotionPageDTO
+from emotions.domain.value_objects.cursor import EmotionCursor
 
 
 class ListEmotions:
-    """List all emotions for user use case."""
+    """List emotions for user use case."""
     
     def __init__(self, emotion_repository):
         """Initialize with repositories."""
         self.emotion_repository = emotion_repository
     
-    def execute(self, user_id: UUID) -> list[EmotionDTO]:
-        """List all emotions for user ordered by created_at desc.
+    async def execute(
+        self,
+        user_id: UUID,
+        limit: int,
+        cursor: str | None = None,
+        from_date: date | None = None,
+        to_date: date | None = None,
+        fields: frozenset[str] | None = None
+    ) -> EmotionPageDTO:
+        """List one page of emotions for user ordered by created_at desc.
         
         Args:
             user_id: Current authenticated user ID
-            
+            limit: Page size
+            cursor: Opaque cursor returned as next_cursor by the previous page;
+                pass the same date range that produced it
+            from_date: Only emotions on or after this date (Colombia timezone)
+            to_date: Only emotions on or before this date (Colombia timezone)
+            fields: Selected optional fields (see parse_fields); all when None
+        
         Returns:
-            List of EmotionDTO ordered by creation date (newest first)
+            EmotionPageDTO with emotions (newest first) and the next page cursor
+            
+        Raises:
+            ValueError: If cursor is malformed or the date range is reversed
         """
-        # Find all emotions
-        emotions = self.emotion_repository.find_all_by_user(user_id)
+        if from_date and to_date and from_date > to_date:
+            raise ValueError("'from' must not be after 'to'")
+        position = EmotionCursor.decode(cursor) if cursor else None
+        
+        # Fetch one extra row to know whether another page exists
+        emotions = await self.emotion_repository.find_all_by_user(
+            user_id,
+            limit=limit + 1,
+            cursor=position,
+            from_date=from_date,
+            to_date=to_date,
+            fields=fields
+        )
+        has_more = len(emotions) > limit
+        emotions = emotions[:limit]
+        
+        next_cursor = None
+        if has_more:
+            last = emotions[-1]
+            next_cursor = EmotionCursor(created_at=last.created_at, id=last.id).encode()
         
         # Convert to DTOs
-        return [
-            EmotionDTO(
-                id=emotion.id,
-                title=emotion.title,
-                text=emotion.text,
-                ai_response=emotion.ai_response,
-                created_at=emotion.created_at
+        if fields is not None:
+            return EmotionPageDTO(
+                items=[
+                    PartialEmotionDTO(
+                        id=emotion.id,
+                        created_at=emotion.created_at,
+                        **{field: getattr(emotion, field) for field in fields}
+                    )
+                    for emotion in emotions
+                ],
+                next_cursor=next_cursor
             )
-            for emotion in emotions
-        ]
+        return EmotionPageDTO(
+            items=[
+                EmotionDTO(
+                    id=emotion.id,
+                    title=emotion.title,
+                    text=emotion.text,
+                    ai_response=emotion.ai_response,
+                    created_at=emotion.created_at
+                )
+                for emotion in emotions
+            ],
+            next_cursor=next_cursor
+        )
@@ -0,0 +1,93 @@
+"""Search emotions use case."""
+
+from uuid import UUID
+
+from emotions.application.dtos.emotion_search_dto import (
+    EmotionSearchPageDTO,
+    EmotionSearchResultDTO,
+    PartialEmotionSearchResultDTO
+)
+from emotions.domain.value_objects.search_cursor import SearchCursor
+
+
+class SearchEmotions:
+    """Full-text search over a user's emotions use case."""
+    
+    def __init__(self, emotion_repository):
+        """Initialize with repositories."""
+        self.emotion_repository = emotion_repository
+    
+    async def execute(
+        self,
+        user_id: UUID,
+        query: str,
+        limit: int,
+        cursor: str | None = None,
+        fields: frozenset[str] | None = None
+    ) -> EmotionSearchPageDTO:
+        """Search title, text and AI response, most relevant first.
+        
+        Args:
+            user_id: Current authenticated user ID
+            query: Web-search style query ("quoted phrases", or, -excluded)
+            limit: Page size
+            cursor: Opaque cursor returned as next_cursor by the previous page
+            fields: Selected optional fields (see parse_fields); all when None
+        
+        Returns:
+            EmotionSearchPageDTO ordered by rank, then newest first
+        
+        Raises:
+            ValueError: If cursor is malformed
+        """
+        position = SearchCursor.decode(cursor) if cursor else None
+        
+        # Fetch one extra row to know whether another page exists
+        hits = await self.emotion_repository.search(
+            user_id,
+            query,
+            limit=limit + 1,
+            cursor=position,
+            fields=fields
+        )
+        has_more = len(hits) > limit
+        hits = hits[:limit]
+        
+        next_cursor = None
+        if has_more:
+            last = hits[-1]
+            next_cursor = SearchCursor(
+                rank=last.rank,
+                created_at=last.emotion.created_at,
+                id=last.emotion.id
+            ).encode()
+        
+        if fields is not None:
+            return EmotionSearchPageDTO(
+                items=[
+                    PartialEmotionSearchResultDTO(
+                        id=hit.emotion.id,
+                        created_at=hit.emotion.created_at,
+                        rank=hit.rank,
+                        snippet=hit.snippet,
+                        **{field: getattr(hit.emotion, field) for field in fields}
+                    )
+                    for hit in hits
+                ],
+                next_cursor=next_cursor
+            )
+        return EmotionSearchPageDTO(
+            items=[
+                EmotionSearchResultDTO(
+                    id=hit.emotion.id,
+                    title=hit.emotion.title,
+                    text=hit.emotion.text,
+                    ai_response=hit.emotion.ai_response,
+                    created_at=hit.emotion.created_at,
+                    rank=hit.rank,
+                    snippet=hit.snippet
+                )
+                for hit in hits
+            ],
+            next_cursor=next_cursor
+        )
@@ -0,0 +1,13 @@
+"""Activity bucket entity."""
+
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass(slots=True)
+class ActivityBucket:
+    """Emotions written in a period (Colombia timezone dates)."""
+    
+    start: date
+    emotions: int
+    active_days: int
@@ -0,0 +1,14 @@
+"""Search hit entity."""
+
+from dataclasses import dataclass
+
+from emotions.domain.entities.emotion import Emotion
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """An emotion matching a full-text search, with its relevance."""
+    
+    emotion: Emotion
+    rank: float
+    snippet: str
@@ -0,0 +1,14 @@
+"""Streak entity."""
+
+from datetime import date
+
+from pydantic import BaseModel
+
+
+class Streak(BaseModel):
+    """User's run of consecutive days with emotions (Colombia timezone)."""
+    
+    has_emotion_today: bool = False
+    current_streak: int = 0
+    longest_streak: int = 0
+    last_emotion_date: date | None = None
@@ -0,0 +1,41 @@
+"""Search results pagination cursor value object."""
+
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class SearchCursor(BaseModel):
+    """Keyset position in a (rank, created_at, id) descending search listing."""
+    
+    rank: float
+    created_at: datetime
+    id: UUID
+    
+    class Config:
+        """Pydantic configuration."""
+        frozen = True
+    
+    def encode(self) -> str:
+        """Encode cursor as an opaque URL-safe token."""
+        # repr() round-trips the float exactly, so the keyset comparison is exact
+        raw = f"{self.rank!r}|{self.created_at.isoformat()}|{self.id}".encode('utf-8')
+        return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+    
+    @staticmethod
+    def decode(token: str) -> 'SearchCursor':
+        """Decode an opaque token produced by encode()."""
+        try:
+            padded = token + '=' * (-len(token) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8')
+            rank, created_at, emotion_id = raw.split('|')
+            return SearchCursor(
+                rank=float(rank),
+                created_at=datetime.fromisoformat(created_at),
+                id=UUID(emotion_id)
+            )
+        except (binascii.Error, UnicodeError, ValueError):
+            raise ValueError("Invalid cursor")
@@ -1,27 +1,54 @@
 """FastAPI routes for emotions."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+import zlib
+from collections.abc import AsyncIterator
+from datetime import date
 
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.infrastructure.api.conditional import conditional_read, make_etag
+from common.infrastructure.api.responses import DTOResponse
 from common.infrastructure.auth.jwt_auth import AuthenticatedUser
-from common.infrastructure.database.session import get_db_session
+from common.infrastructure.database.session import async_session_scope, get_async_db_session
+from emotions.application.dtos.activity_dto import ActivityStatsDTO, CalendarDTO
+from emotions.application.dtos.batch_emotion_dto import CreateEmotionBatchDTO, EmotionBatchResultDTO
 from emotions.application.dtos.create_emotion_dto import CreateEmotionDTO
-from emotions.application.dtos.emotion_dto import EmotionDTO
+from emotions.application.dtos.emotion_dto import EmotionDTO, fields_key, parse_fields
+from emotions.application.dtos.emotion_page_dto import EmotionPageDTO
+from emotions.application.dtos.emotion_search_dto import EmotionSearchPageDTO
 from emotions.application.dtos.streak_dto import StreakDTO
 from emotions.application.use_cases.create_emotion import CreateEmotion
-from emotions.application.use_cases.list_emotions import ListEmotions
+from emotions.application.use_cases.create_emotion_batch import CreateEmotionBatch
+from emotions.application.use_cases.export_emotions import ExportEmotions
+from emotions.application.use_cases.get_activity_stats import GRANULARITIES, GetActivityStats
+from emotions.application.use_cases.get_calendar import GetCalendar
 from emotions.application.use_cases.get_streak import GetStreak
+from emotions.application.use_cases.list_emotions import ListEmotions
+from emotions.application.use_cases.search_emotions import SearchEmotions
+from emotions.infrastructure.database.daily_count_repository import EmotionDailyCountRepository
+from emotions.infrastructure.database.models import colombia_now
 from emotions.infrastructure.database.repository import EmotionRepository
+from emotions.infrastructure.database.user_streak_repository import UserStreakRepository
 
 # Router
 router = APIRouter()
 
+# Bytes buffered per chunk when streaming exports
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+FIELDS_DESCRIPTION = (
+    "Comma-separated subset of title,text,ai_response; id and created_at are always included"
+)
+
 
 @router.post("", response_model=EmotionDTO, status_code=status.HTTP_201_CREATED)
-def create_emotion(
+async def create_emotion(
     data: CreateEmotionDTO,
     current_user: AuthenticatedUser,
-    session: Session = Depends(get_db_session)
+    session: AsyncSession = Depends(get_async_db_session)
 ):
     """Create emotion for authenticated user.
     
@@ -30,8 +57,11 @@ def create_emotion(
     """
     try:
         emotion_repo = EmotionRepository(session)
-        use_case = CreateEmotion(emotion_repo)
-        return use_case.execute(current_user.id, data)
+        user_streak_repo = UserStreakRepository(session)
+        daily_count_repo = EmotionDailyCountRepository(session)
+        use_case = CreateEmotion(emotion_repo, user_streak_repo, daily_count_repo)
+        emotion = await use_case.execute(current_user.id, data)
+        return DTOResponse(emotion, status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -39,35 +69,364 @@ def create_emotion(
         )
 
 
-@router.get("", response_model=list[EmotionDTO])
-def list_emotions(
+@router.post("/batch", response_model=EmotionBatchResultDTO)
+async def create_emotions_batch(
+    data: CreateEmotionBatchDTO,
     current_user: AuthenticatedUser,
-    session: Session = Depends(get_db_session)
+    session: AsyncSession = Depends(get_async_db_session)
 ):
-    """List all emotions for authenticated user.
+    """Create many emotions recorded offline in a single request.
     
-    Returns emotions ordered by creation date (newest first).
+    Each item is validated like POST /api/emotions and may carry a
+    client-generated id and created_at. Valid items are inserted together;
+    items whose id was already stored are reported as duplicates, so retrying
+    a batch is safe. Results are returned in request order.
     Requires JWT bearer token in Authorization header.
     """
-    emotion_repo = EmotionRepository(session)
-    use_case = ListEmotions(emotion_repo)
-    return use_case.execute(current_user.id)
+    try:
+        emotion_repo = EmotionRepository(session)
+        user_streak_repo = UserStreakRepository(session)
+        daily_count_repo = EmotionDailyCountRepository(session)
+        use_case = CreateEmotionBatch(emotion_repo, user_streak_repo, daily_count_repo)
+        return DTOResponse(await use_case.execute(current_user.id, data))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
 
-@router.get("/streak", response_model=StreakDTO)
-def get_streak(
+@router.get("", response_model=EmotionPageDTO, responses={304: {"description": "Not Modified"}})
+async def list_emotions(
     current_user: AuthenticatedUser,
-    session: Session = Depends(get_db_session)
+    limit: int = Query(50, ge=1, le=100, description="Page size"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    from_date: date | None = Query(
+        None,
+        alias="from",
+        description="First day included (Colombia timezone)"
+    ),
+    to_date: date | None = Query(
+        None,
+        alias="to",
+        description="Last day included (Colombia timezone)"
+    ),
+    fields: str | None = Query(
+        None,
+        description=FIELDS_DESCRIPTION
+    ),
+    if_none_match: str | None = Header(None),
+    session: AsyncSession = Depends(get_async_db_session)
+):
+    """List emotions for authenticated user, one page at a time.
+    
+    Returns emotions ordered by creation date (newest first) and a
+    next_cursor to pass back for the following page (null on the last page).
+    Optional from/to dates (YYYY-MM-DD, both inclusive) restrict the
+    listing to a range of days; keep them when following next_cursor.
+    fields (e.g. ?fields=title) returns only those columns, skipping the
+    long text and AI response when a client only needs to render a list.
+    Responses carry an ETag; send it back in If-None-Match to get
+    304 Not Modified while the page is unchanged.
+    Requires JWT bearer token in Authorization header.
+    """
+    async def compute_etag() -> str:
+        # Read the version before the rows: a concurrent write then at worst
+        # tags newer rows with an older version, costing one extra refetch
+        version = await UserStreakRepository(session).get_version(current_user.id)
+        return make_etag(
+            "emotions",
+            current_user.id,
+            version,
+            limit,
+            cursor,
+            from_date,
+            to_date,
+            fields_key(selected)
+        )
+    
+    async def load() -> EmotionPageDTO:
+        use_case = ListEmotions(EmotionRepository(session))
+        return await use_case.execute(
+            current_user.id,
+            limit=limit,
+            cursor=cursor,
+            from_date=from_date,
+            to_date=to_date,
+            fields=selected
+        )
+    
+    try:
+        selected = parse_fields(fields)
+        return await conditional_read(
+            current_user.id,
+            f"list:{limit}:{cursor}:{from_date}:{to_date}:{fields_key(selected)}",
+            if_none_match,
+            compute_etag,
+            load
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.get(
+    "/search",
+    response_model=EmotionSearchPageDTO,
+    responses={304: {"description": "Not Modified"}}
+)
+async def search_emotions(
+    current_user: AuthenticatedUser,
+    q: str = Query(..., min_length=1, max_length=200, description="Search terms"),
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    fields: str | None = Query(
+        None,
+        description=FIELDS_DESCRIPTION
+    ),
+    if_none_match: str | None = Header(None),
+    session: AsyncSession = Depends(get_async_db_session)
+):
+    """Full-text search over the authenticated user's emotions.
+    
+    Matches title, text and AI response (Spanish stemming, so "caminar"
+    also finds "caminé"). Accepts web-search syntax: "quoted phrases",
+    or, and -excluded words. Results are ordered by relevance, title
+    matches first, each with a snippet of the text where matches are
+    wrapped in **. Paginate with next_cursor; ETags and fields work as in
+    the list (rank and snippet are always returned). Archived emotions
+    (older than EMOTIONS_HOT_DAYS) are not searched.
+    Requires JWT bearer token in Authorization header.
+    """
+    async def compute_etag() -> str:
+        version = await UserStreakRepository(session).get_version(current_user.id)
+        return make_etag("search", current_user.id, version, limit, cursor, fields_key(selected), q)
+    
+    async def load() -> EmotionSearchPageDTO:
+        use_case = SearchEmotions(EmotionRepository(session))
+        return await use_case.execute(
+            current_user.id,
+            q,
+            limit=limit,
+            cursor=cursor,
+            fields=selected
+        )
+    
+    try:
+        selected = parse_fields(fields)
+        return await conditional_read(
+            current_user.id,
+            # q last: it may contain the separator
+            f"search:{limit}:{cursor}:{fields_key(selected)}:{q}",
+            if_none_match,
+            compute_etag,
+            load
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}, "application/gzip": {}}}}
+)
+async def export_emotions(
+    current_user: AuthenticatedUser,
+    gzip: bool = Query(False, description="Gzip-compress the NDJSON file"),
+    fields: str | None = Query(
+        None,
+        description=FIELDS_DESCRIPTION
+    )
+):
+    """Download the authenticated user's full emotion history.
+    
+    Streams one EmotionDTO JSON object per line (newest first), optionally
+    gzip-compressed. Rows are read through a server-side cursor, so memory
+    stays flat regardless of history size. fields works as in the list.
+    Requires JWT bearer token in Authorization header.
+    """
+    # Validate before streaming: errors cannot change the status once it starts
+    try:
+        selected = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    body = _export_ndjson(current_user.id, selected)
+    filename = "emotions.ndjson"
+    media_type = "application/x-ndjson"
+    if gzip:
+        body = _gzip_stream(body)
+        filename += ".gz"
+        media_type = "application/gzip"
+    
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+async def _export_ndjson(user_id, fields: frozenset[str] | None = None) -> AsyncIterator[bytes]:
+    """Serialize a user's emotions as NDJSON, buffered into chunks.
+    
+    Opens its own session because the stream outlives the request handler.
+    """
+    async with async_session_scope() as session:
+        use_case = ExportEmotions(EmotionRepository(session))
+        buffer = bytearray()
+        async for emotion in use_case.execute(user_id, fields=fields):
+            buffer += to_json(emotion)
+            buffer += b"\n"
+            if len(buffer) >= EXPORT_CHUNK_SIZE:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+
+async def _gzip_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Gzip-compress a byte stream incrementally."""
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+@router.get("/streak", response_model=StreakDTO, responses={304: {"description": "Not Modified"}})
+async def get_streak(
+    current_user: AuthenticatedUser,
+    if_none_match: str | None = Header(None),
+    session: AsyncSession = Depends(get_async_db_session)
 ):
     """Get emotion streak for authenticated user.
     
     Returns:
     - has_emotion_today: whether user created emotion today
     - current_streak: number of consecutive days with emotions
+    - longest_streak: longest run of consecutive days ever
     - last_emotion_date: date of most recent emotion
     
+    Supports ETag / If-None-Match like the emotions list; the ETag also
+    changes at midnight, when current_streak may lapse.
+    Requires JWT bearer token in Authorization header.
+    """
+    user_streak_repo = UserStreakRepository(session)
+    today = colombia_now().date()
+    
+    async def compute_etag() -> str:
+        version = await user_streak_repo.get_version(current_user.id)
+        return make_etag("streak", current_user.id, version, today)
+    
+    async def load() -> StreakDTO:
+        use_case = GetStreak(user_streak_repo, EmotionRepository(session))
+        return await use_case.execute(current_user.id)
+    
+    return await conditional_read(
+        current_user.id,
+        f"streak:{today}",
+        if_none_match,
+        compute_etag,
+        load
+    )
+
+
+@router.get(
+    "/calendar",
+    response_model=CalendarDTO,
+    responses={304: {"description": "Not Modified"}}
+)
+async def get_calendar(
+    current_user: AuthenticatedUser,
+    year: int | None = Query(
+        None,
+        ge=1970,
+        le=2100,
+        description="Calendar year (default: current)"
+    ),
+    if_none_match: str | None = Header(None),
+    session: AsyncSession = Depends(get_async_db_session)
+):
+    """Emotions per day of a year, for a heatmap.
+    
+    counts holds one number per day of the year (Colombia timezone),
+    starting on January 1st. Supports ETag / If-None-Match like the
+    emotions list.
+    Requires JWT bearer token in Authorization header.
+    """
+    year = year or colombia_now().year
+    
+    async def compute_etag() -> str:
+        version = await UserStreakRepository(session).get_version(current_user.id)
+        return make_etag("calendar", current_user.id, version, year)
+    
+    async def load() -> CalendarDTO:
+        use_case = GetCalendar(EmotionDailyCountRepository(session))
+        return await use_case.execute(current_user.id, year)
+    
+    return await conditional_read(
+        current_user.id,
+        f"calendar:{year}",
+        if_none_match,
+        compute_etag,
+        load
+    )
+
+
+@router.get(
+    "/stats",
+    response_model=ActivityStatsDTO,
+    responses={304: {"description": "Not Modified"}}
+)
+async def get_activity_stats(
+    current_user: AuthenticatedUser,
+    granularity: str = Query(
+        "month",
+        description=f"One of: {', '.join(GRANULARITIES)}"
+    ),
+    year: int | None = Query(
+        None,
+        ge=1970,
+        le=2100,
+        description="Only this year (default: all history)"
+    ),
+    if_none_match: str | None = Header(None),
+    session: AsyncSession = Depends(get_async_db_session)
+):
+    """Emotions and active days per month or year.
+    
+    Periods are listed oldest first; periods without emotions are omitted.
+    Supports ETag / If-None-Match like the emotions list.
     Requires JWT bearer token in Authorization header.
     """
-    emotion_repo = EmotionRepository(session)
-    use_case = GetStreak(emotion_repo)
-    return use_case.execute(current_user.id)
+    async def compute_etag() -> str:
+        version = await UserStreakRepository(session).get_version(current_user.id)
+        return make_etag("stats", current_user.id, version, granularity, year)
+    
+    async def load() -> ActivityStatsDTO:
+        use_case = GetActivityStats(EmotionDailyCountRepository(session))
+        return await use_case.execute(current_user.id, granularity, year)
+    
+    try:
+        return await conditional_read(
+            current_user.id,
+            f"stats:{granularity}:{year}",
+            if_none_match,
+            compute_etag,
+            load
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
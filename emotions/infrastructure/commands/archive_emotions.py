@@ -0,0 +1,90 @@
+"""Move emotions older than the hot window into emotion_archives.
+
+Runs in batches of users, each moved in its own transaction, so the live
+table stays writable. Monthly partitions left empty are then truncated to
+release their index pages. Safe to stop and rerun; schedule it, e.g. daily.
+
+Usage:
+    python -m emotions.infrastructure.commands.archive_emotions
+        [--hot-days 90] [--batch-size 500] [--pause 0.0]
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from uuid import UUID
+
+from dotenv import load_dotenv
+from sqlalchemy.exc import DBAPIError
+
+from common.infrastructure.database.session import async_session_scope, dispose_engines
+from emotions.infrastructure.database.archive import archive_batch, hot_window_start
+from emotions.infrastructure.database.partitions import partitions_before, truncate_if_empty
+
+
+async def archive_emotions(
+    before: datetime,
+    batch_size: int,
+    pause: float
+) -> tuple[int, int, list[str]]:
+    """Archive all users batch by batch, then truncate emptied partitions.
+    
+    Returns:
+        Emotions moved, archive rows written and partitions truncated
+    """
+    after = UUID(int=0)
+    moved = months = 0
+    try:
+        while True:
+            async with async_session_scope() as session:
+                last_user_id, batch_moved, batch_months, _ = await archive_batch(
+                    session, after, batch_size, before
+                )
+            if last_user_id is None:
+                break
+            moved += batch_moved
+            months += batch_months
+            after = last_user_id
+            if pause:
+                await asyncio.sleep(pause)
+        
+        async with async_session_scope() as session:
+            partitions = await partitions_before(session, before.date())
+        truncated = []
+        for partition in partitions:
+            try:
+                async with async_session_scope() as session:
+                    if await truncate_if_empty(session, partition):
+                        truncated.append(partition)
+            except DBAPIError as e:
+                # Lock timeout: busy partition, retried on the next run
+                print(f"Skipped {partition}: {e.orig}")
+        return moved, months, truncated
+    finally:
+        await dispose_engines()
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--hot-days", type=int, help="Minimum age in days (default: EMOTIONS_HOT_DAYS or 90)"
+    )
+    parser.add_argument("--batch-size", type=int, default=500, help="Users per transaction")
+    parser.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches")
+    args = parser.parse_args()
+    
+    load_dotenv()
+    before = hot_window_start(args.hot_days)
+    started = time.perf_counter()
+    moved, months, truncated = asyncio.run(archive_emotions(before, args.batch_size, args.pause))
+    print(
+        f"Archived {moved} emotions created before {before:%Y-%m-%d} "
+        f"into {months} user-months and truncated {len(truncated)} partitions "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Copy existing emotions into the partitioned table (between migrations 009 and 010).
+
+Copies in small batches, each in its own transaction, so the live table
+stays writable; writes made meanwhile are mirrored by triggers. Safe to
+stop and rerun. Run `alembic upgrade 010` afterwards to swap the tables.
+
+Usage:
+    python -m emotions.infrastructure.commands.backfill_emotion_partitions
+        [--batch-size 5000] [--pause 0.0]
+"""
+
+import argparse
+import asyncio
+import time
+from uuid import UUID
+
+from dotenv import load_dotenv
+
+from common.infrastructure.database.session import async_session_scope, dispose_engines
+from emotions.infrastructure.database.partitions import backfill_batch
+
+
+async def backfill_emotion_partitions(batch_size: int, pause: float) -> int:
+    """Copy all emotions batch by batch; returns the number of rows copied."""
+    after = UUID(int=0)
+    total = 0
+    try:
+        while True:
+            async with async_session_scope() as session:
+                last_id, copied = await backfill_batch(session, after, batch_size)
+            if last_id is None:
+                return total
+            total += copied
+            after = last_id
+            if pause:
+                await asyncio.sleep(pause)
+    finally:
+        await dispose_engines()
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows per transaction")
+    parser.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches")
+    args = parser.parse_args()
+    
+    load_dotenv()
+    started = time.perf_counter()
+    count = asyncio.run(backfill_emotion_partitions(args.batch_size, args.pause))
+    print(f"Copied {count} emotions in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
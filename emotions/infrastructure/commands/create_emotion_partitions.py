@@ -0,0 +1,43 @@
+"""Create upcoming monthly partitions of the emotions table.
+
+Run at least monthly (e.g. from cron); months that already have a partition
+are skipped, so it is safe to run often. Emotions outside every partition
+land in emotions_pdefault and are moved when their month is created.
+
+Usage:
+    python -m emotions.infrastructure.commands.create_emotion_partitions [--months-ahead 3]
+"""
+
+import argparse
+import asyncio
+
+from dotenv import load_dotenv
+
+from common.infrastructure.database.session import async_session_scope, dispose_engines
+from emotions.infrastructure.database.models import colombia_now
+from emotions.infrastructure.database.partitions import create_partitions
+
+
+async def create_emotion_partitions(months_ahead: int) -> int:
+    """Create partitions from the current month through months_ahead."""
+    first_month = colombia_now().date().replace(day=1)
+    try:
+        async with async_session_scope() as session:
+            return await create_partitions(session, first_month, months_ahead + 1)
+    finally:
+        await dispose_engines()
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--months-ahead", type=int, default=3, help="Months after the current one")
+    args = parser.parse_args()
+    
+    load_dotenv()
+    count = asyncio.run(create_emotion_partitions(args.months_ahead))
+    print(f"Created {count} partitions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Rebuild the emotion_daily_counts rollup from emotions.
+
+Usage:
+    python -m emotions.infrastructure.commands.rebuild_daily_counts [--user-id UUID]
+"""
+
+import argparse
+import asyncio
+from uuid import UUID
+
+from dotenv import load_dotenv
+
+from common.infrastructure.database.session import async_session_scope, dispose_engines
+from emotions.infrastructure.database.daily_count_repository import EmotionDailyCountRepository
+from emotions.infrastructure.database.user_streak_repository import UserStreakRepository
+
+
+async def rebuild_daily_counts(user_id: UUID | None = None) -> int:
+    """Recompute rollup rows in one transaction."""
+    try:
+        async with async_session_scope() as session:
+            count = await EmotionDailyCountRepository(session).rebuild(user_id)
+            # Calendar and stats ETags derive from the streak version
+            await UserStreakRepository(session).bump_version(user_id)
+            return count
+    finally:
+        await dispose_engines()
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--user-id", type=UUID, help="Only rebuild this user")
+    args = parser.parse_args()
+    
+    load_dotenv()
+    count = asyncio.run(rebuild_daily_counts(args.user_id))
+    print(f"Rebuilt {count} daily count rows")
+
+
+if __name__ == "__main__":
+    main()
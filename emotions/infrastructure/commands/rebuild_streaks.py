@@ -0,0 +1,38 @@
+"""Rebuild the user_streaks read model from emotions.
+
+Usage:
+    python -m emotions.infrastructure.commands.rebuild_streaks [--user-id UUID]
+"""
+
+import argparse
+import asyncio
+from uuid import UUID
+
+from dotenv import load_dotenv
+
+from common.infrastructure.database.session import async_session_scope, dispose_engines
+from emotions.infrastructure.database.user_streak_repository import UserStreakRepository
+
+
+async def rebuild_streaks(user_id: UUID | None = None) -> int:
+    """Recompute streak rows in one transaction."""
+    try:
+        async with async_session_scope() as session:
+            return await UserStreakRepository(session).rebuild(user_id)
+    finally:
+        await dispose_engines()
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--user-id", type=UUID, help="Only rebuild this user")
+    args = parser.parse_args()
+    
+    load_dotenv()
+    count = asyncio.run(rebuild_streaks(args.user_id))
+    print(f"Rebuilt {count} streak rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Cold storage of old emotions.
+
+Emotions older than the hot window are moved out of the emotions table into
+emotion_archives, one JSON array per user and Colombia calendar month, so the
+hot table and its indexes only hold recent rows. EmotionRepository merges
+the archive into listings and exports, and streak and rollup rebuilds count
+archived dates; emotions are not full-text searchable once archived.
+"""
+
+import os
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from emotions.infrastructure.database.models import colombia_midnight, colombia_now
+from emotions.infrastructure.database.user_streak_repository import UserStreakRepository
+
+# Moves one batch of users in a single statement, so every emotion is in
+# exactly one of the two tables for any reader. Months archived earlier are
+# appended to, e.g. when an offline batch was recorded with an old date.
+_ARCHIVE_BATCH = text("""
+    WITH batch AS (
+        SELECT id FROM users
+        WHERE id > :after
+        ORDER BY id
+        LIMIT :batch_size
+    ), moved AS (
+        DELETE FROM emotions e
+        USING batch
+        WHERE e.user_id = batch.id AND e.created_at < :before
+        RETURNING e.id, e.user_id, e.title, e.text, e.ai_response, e.created_at
+    ), months AS (
+        SELECT
+            user_id,
+            date_trunc('month', created_at AT TIME ZONE 'America/Bogota')::date AS month,
+            jsonb_agg(
+                jsonb_build_object(
+                    'id', id, 'title', title, 'text', text,
+                    'ai_response', ai_response, 'created_at', created_at
+                )
+                ORDER BY created_at DESC, id DESC
+            ) AS payload,
+            array_agg(
+                (created_at AT TIME ZONE 'America/Bogota')::date ORDER BY created_at
+            ) AS local_dates,
+            min(created_at) AS first_created_at,
+            max(created_at) AS last_created_at
+        FROM moved
+        GROUP BY 1, 2
+    ), archived AS (
+        INSERT INTO emotion_archives AS a (
+            user_id, month, payload, local_dates, first_created_at, last_created_at
+        )
+        SELECT user_id, month, payload, local_dates, first_created_at, last_created_at FROM months
+        ON CONFLICT (user_id, month) DO UPDATE SET
+            payload = a.payload || excluded.payload,
+            local_dates = a.local_dates || excluded.local_dates,
+            first_created_at = least(a.first_created_at, excluded.first_created_at),
+            last_created_at = greatest(a.last_created_at, excluded.last_created_at)
+        RETURNING 1
+    )
+    SELECT
+        (SELECT id FROM batch ORDER BY id DESC LIMIT 1) AS last_user_id,
+        (SELECT count(*) FROM moved) AS moved,
+        (SELECT count(*) FROM archived) AS months,
+        (SELECT array_agg(DISTINCT user_id) FROM moved) AS user_ids
+""")
+
+
+def hot_window_start(hot_days: int | None = None) -> datetime:
+    """Start of the hot window: emotions created before it are archived.
+    
+    Aligned to the first day of a Colombia calendar month, so each archive
+    row is written once rather than appended to on every run.
+    
+    Args:
+        hot_days: Minimum age in days of archived emotions; EMOTIONS_HOT_DAYS
+            (default 90) when None
+    """
+    if hot_days is None:
+        hot_days = int(os.getenv("EMOTIONS_HOT_DAYS", "90"))
+    day = colombia_now().date() - timedelta(days=hot_days)
+    return colombia_midnight(day.replace(day=1))
+
+
+async def archive_batch(
+    session: AsyncSession,
+    after: UUID,
+    batch_size: int,
+    before: datetime
+) -> tuple[UUID | None, int, int, list[UUID]]:
+    """Move the emotions created before `before` of the next batch of users (by id).
+    
+    Archived emotions drop out of search results, so the versions of the
+    users moved are bumped and their cached reads invalidated on commit.
+    
+    Returns:
+        Last user id read (None when there are no more users), emotions
+        moved, archive rows written and the ids of the users moved
+    """
+    result = await session.execute(
+        _ARCHIVE_BATCH,
+        {"after": after, "batch_size": batch_size, "before": before}
+    )
+    row = result.one()
+    user_ids = row.user_ids or []
+    await UserStreakRepository(session).bump_versions(user_ids)
+    return row.last_user_id, row.moved, row.months, user_ids
@@ -0,0 +1,121 @@
+"""Emotion daily counts rollup repository."""
+
+from collections import Counter
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import Date, cast, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from emotions.domain.entities.activity import ActivityBucket
+from emotions.infrastructure.database.models import EmotionDailyCountModel
+from emotions.infrastructure.database.streak_queries import emotion_dates
+
+
+class EmotionDailyCountRepository:
+    """Maintain and read the per-user, per-day emotion counts rollup.
+    
+    Calendar and stats reads scan at most one row per day with emotions
+    through the (user_id, local_date) primary key, never the emotions.
+    """
+    
+    def __init__(self, session: AsyncSession):
+        """Initialize with async database session."""
+        self.session = session
+    
+    async def record_emotion_dates(self, user_id: UUID, emotion_dates: list[date]) -> None:
+        """Add new emotions' local dates to the counts (one atomic upsert)."""
+        if not emotion_dates:
+            return
+        
+        stmt = insert(EmotionDailyCountModel).values([
+            {"user_id": user_id, "local_date": emotion_date, "count": count}
+            for emotion_date, count in sorted(Counter(emotion_dates).items())
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EmotionDailyCountModel.user_id, EmotionDailyCountModel.local_date],
+            set_={EmotionDailyCountModel.count: EmotionDailyCountModel.count + stmt.excluded.count}
+        )
+        await self.session.execute(stmt)
+    
+    async def get_daily_counts(self, user_id: UUID, start: date, end: date) -> dict[date, int]:
+        """Counts per local date in [start, end); days without emotions are absent."""
+        stmt = select(EmotionDailyCountModel.local_date, EmotionDailyCountModel.count).where(
+            EmotionDailyCountModel.user_id == user_id,
+            EmotionDailyCountModel.local_date >= start,
+            EmotionDailyCountModel.local_date < end
+        ).order_by(EmotionDailyCountModel.local_date)
+        
+        result = await self.session.execute(stmt)
+        return {row.local_date: row.count for row in result.all()}
+    
+    async def get_buckets(
+        self,
+        user_id: UUID,
+        granularity: str,
+        start: date | None = None,
+        end: date | None = None
+    ) -> list[ActivityBucket]:
+        """Totals per period, oldest first; periods without emotions are absent.
+        
+        Args:
+            user_id: Owner of the emotions
+            granularity: A date_trunc unit, e.g. 'month' or 'year'
+            start: First local date included (unbounded when None)
+            end: First local date excluded (unbounded when None)
+        """
+        period = cast(
+            func.date_trunc(granularity, EmotionDailyCountModel.local_date), Date
+        ).label('start')
+        stmt = select(
+            period,
+            func.sum(EmotionDailyCountModel.count).label('emotions'),
+            func.count().label('active_days')
+        ).where(
+            EmotionDailyCountModel.user_id == user_id
+        ).group_by(period).order_by(period)
+        
+        if start is not None:
+            stmt = stmt.where(EmotionDailyCountModel.local_date >= start)
+        if end is not None:
+            stmt = stmt.where(EmotionDailyCountModel.local_date < end)
+        
+        result = await self.session.execute(stmt)
+        return [
+            ActivityBucket(start=row.start, emotions=row.emotions, active_days=row.active_days)
+            for row in result.all()
+        ]
+    
+    async def rebuild(self, user_id: UUID | None = None) -> int:
+        """Recompute counts from emotions (backfill and drift repair).
+        
+        Args:
+            user_id: Rebuild one user; all users when None
+        
+        Returns:
+            Number of rows written
+        """
+        stale = delete(EmotionDailyCountModel)
+        if user_id is not None:
+            stale = stale.where(EmotionDailyCountModel.user_id == user_id)
+        await self.session.execute(stale)
+        
+        # Archived emotions count too: the rollup covers the whole history
+        dates = emotion_dates(user_id)
+        counts = select(
+            dates.c.user_id,
+            dates.c.day.label('local_date'),
+            func.count().label('count')
+        ).group_by(dates.c.user_id, dates.c.day)
+        
+        stmt = insert(EmotionDailyCountModel).from_select(
+            ['user_id', 'local_date', 'count'], counts
+        )
+        # A concurrent insert may re-create a deleted row first; the recount includes it
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EmotionDailyCountModel.user_id, EmotionDailyCountModel.local_date],
+            set_={EmotionDailyCountModel.count: stmt.excluded.count}
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount
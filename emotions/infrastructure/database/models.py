@@ -1,22 +1,50 @@
 """Emotion database model."""
 
-from datetime import datetime
+from datetime import date, datetime, time
 from uuid import uuid4
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Computed,
+    Date,
+    String,
+    Text,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR, UUID
+from sqlalchemy.orm import deferred
 
 from common.infrastructure.database.base import Base
 
 COLOMBIA_TZ = ZoneInfo("America/Bogota")
 
+# Text search configuration for emotion content
+SEARCH_CONFIG = "spanish"
+
 
 def colombia_now() -> datetime:
     """Get current datetime in Colombia timezone."""
     return datetime.now(COLOMBIA_TZ)
 
 
+def to_colombia(value: datetime) -> datetime:
+    """Convert a stored timestamp to Colombia timezone."""
+    if value.tzinfo is None:
+        # If naive datetime, assume UTC
+        return value.replace(tzinfo=ZoneInfo("UTC")).astimezone(COLOMBIA_TZ)
+    return value.astimezone(COLOMBIA_TZ)
+
+
+def colombia_midnight(day: date) -> datetime:
+    """Start of a Colombia timezone date as an aware datetime."""
+    return datetime.combine(day, time(), COLOMBIA_TZ)
+
+
 class EmotionModel(Base):
     """Emotion database model."""
     
@@ -27,12 +55,73 @@ class EmotionModel(Base):
     title = Column(String(100), nullable=False)
     text = Column(Text, nullable=False)
     ai_response = Column(Text, nullable=False)
-    created_at = Column(DateTime(timezone=True), default=colombia_now, nullable=False)
+    # Partition key, hence part of the primary key
+    created_at = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        default=colombia_now,
+        nullable=False
+    )
+    # Maintained by PostgreSQL; deferred so loading a model never pays for it
+    search_vector = deferred(Column(TSVECTOR, Computed(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', title), 'A') || "
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', text), 'B') || "
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', ai_response), 'C')",
+        persisted=True
+    )))
+    
+    __table_args__ = (
+        # Serves per-user listings ordered by (created_at, id) desc and keyset pagination
+        Index("ix_emotions_user_id_created_at_id", user_id, created_at.desc(), id.desc()),
+        # Full-text search; combined with the index above to restrict to one user
+        Index("ix_emotions_search_vector", search_vector, postgresql_using="gin"),
+        # One partition per Colombia calendar month (migrations 009 and 010)
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
     
     @property
     def created_at_colombia(self) -> datetime:
         """Get created_at converted to Colombia timezone."""
-        if self.created_at.tzinfo is None:
-            # If naive datetime, assume UTC
-            return self.created_at.replace(tzinfo=ZoneInfo("UTC")).astimezone(COLOMBIA_TZ)
-        return self.created_at.astimezone(COLOMBIA_TZ)
+        return to_colombia(self.created_at)
+
+
+class UserStreakModel(Base):
+    """Per-user streak read model, maintained on every emotion insert."""
+    
+    __tablename__ = "user_streaks"
+    
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    current_streak = Column(Integer, nullable=False)
+    longest_streak = Column(Integer, nullable=False)
+    last_emotion_date = Column(Date, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=colombia_now, nullable=False)
+    # Bumped on every change to the user's emotions; feeds HTTP ETags
+    version = Column(BigInteger, default=1, nullable=False)
+
+
+class EmotionDailyCountModel(Base):
+    """Emotions per user and local date, maintained on every emotion insert."""
+    
+    __tablename__ = "emotion_daily_counts"
+    
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    # Date in Colombia timezone
+    local_date = Column(Date, primary_key=True)
+    count = Column(Integer, nullable=False)
+
+
+class EmotionArchiveModel(Base):
+    """Emotions moved out of the hot table, one row per user and Colombia calendar month."""
+    
+    __tablename__ = "emotion_archives"
+    
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    # First day of the month
+    month = Column(Date, primary_key=True)
+    # JSON array of {id, title, text, ai_response, created_at}; compressed by TOAST
+    payload = Column(JSONB, nullable=False)
+    # Local date of every archived emotion (repeated per emotion), for streaks and rebuilds
+    local_dates = Column(ARRAY(Date), nullable=False)
+    # created_at range, so reads skip months without decompressing the payload
+    first_created_at = Column(DateTime(timezone=True), nullable=False)
+    last_created_at = Column(DateTime(timezone=True), nullable=False)
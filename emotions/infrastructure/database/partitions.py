@@ -0,0 +1,113 @@
+"""Maintenance of the monthly emotions partitions.
+
+Partitions are named emotions_pYYYYMM and cover one Colombia calendar month
+of created_at; emotions_pdefault catches anything outside them. The SQL
+function create_emotion_partitions() is installed by migration 009.
+"""
+
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Columns copied between the plain and partitioned tables (search_vector is generated)
+COPY_COLUMNS = "id, user_id, title, text, ai_response, created_at"
+
+_BACKFILL_BATCH = text(f"""
+    WITH batch AS (
+        SELECT {COPY_COLUMNS} FROM emotions
+        WHERE id > :after
+        ORDER BY id
+        LIMIT :batch_size
+    ), copied AS (
+        INSERT INTO emotions_partitioned ({COPY_COLUMNS})
+        SELECT {COPY_COLUMNS} FROM batch
+        ON CONFLICT DO NOTHING
+        RETURNING 1
+    )
+    SELECT
+        (SELECT id FROM batch ORDER BY id DESC LIMIT 1) AS last_id,
+        (SELECT count(*) FROM copied) AS copied
+""")
+
+
+async def create_partitions(
+    session: AsyncSession,
+    first_month: date,
+    months: int,
+    parent: str = "emotions"
+) -> int:
+    """Create missing monthly partitions starting at first_month.
+    
+    Rows of those months found in the default partition are moved into the
+    new partitions. Returns the number of partitions created.
+    """
+    result = await session.execute(
+        text("SELECT create_emotion_partitions(CAST(:parent AS regclass), :first_month, :months)"),
+        {"parent": parent, "first_month": first_month, "months": months}
+    )
+    return result.scalar_one()
+
+
+async def backfill_batch(
+    session: AsyncSession,
+    after: UUID,
+    batch_size: int
+) -> tuple[UUID | None, int]:
+    """Copy the next batch of emotions (by id) into emotions_partitioned.
+    
+    Rows already copied, e.g. by the mirror triggers, are skipped.
+    
+    Returns:
+        Last id read (None when there are no more rows) and rows copied
+    """
+    result = await session.execute(_BACKFILL_BATCH, {"after": after, "batch_size": batch_size})
+    row = result.one()
+    return row.last_id, row.copied
+
+
+async def partitions_before(
+    session: AsyncSession,
+    month: date,
+    parent: str = "emotions"
+) -> list[str]:
+    """Names of the monthly partitions covering months before month's, oldest first."""
+    result = await session.execute(
+        text("""
+            SELECT c.relname FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = CAST(:parent AS regclass)
+                AND c.relname ~ '^emotions_p[0-9]{6}$'
+                AND c.relname < 'emotions_p' || to_char(CAST(:month AS date), 'YYYYMM')
+            ORDER BY c.relname
+        """),
+        {"parent": parent, "month": month}
+    )
+    return list(result.scalars())
+
+
+async def truncate_if_empty(
+    session: AsyncSession,
+    partition: str,
+    lock_timeout: str = "2s"
+) -> bool:
+    """Truncate a partition emptied by archiving, releasing its index pages.
+    
+    VACUUM returns the heap pages of deleted rows but leaves index pages
+    allocated; TRUNCATE swaps in empty files. Only the partition is locked,
+    for at most lock_timeout before the statement fails.
+    
+    Returns:
+        False, leaving the partition alone, if it still has rows
+    """
+    await session.execute(
+        text("SELECT set_config('lock_timeout', :timeout, true)"),
+        {"timeout": lock_timeout}
+    )
+    await session.execute(text(f'LOCK TABLE "{partition}" IN ACCESS EXCLUSIVE MODE'))
+    has_rows = await session.execute(text(f'SELECT EXISTS (SELECT 1 FROM "{partition}")'))
+    if has_rows.scalar_one():
+        return False
+    await session.execute(text(f'TRUNCATE "{partition}"'))
+    return True
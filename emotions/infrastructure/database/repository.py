@@ -1,93 +1,374 @@
 """Emotion repository implementation."""
 
-from datetime import date
+from datetime import date, timedelta
+from typing import AsyncIterator, Collection
 from uuid import UUID
 
-from sqlalchemy import select, and_, func, desc
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    REAL,
+    Date,
+    DateTime,
+    column,
+    exists,
+    insert,
+    null,
+    select,
+    and_,
+    cast,
+    func,
+    desc,
+    literal,
+    true,
+    tuple_,
+    union_all,
+    values
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from emotions.domain.entities.emotion import Emotion
-from emotions.infrastructure.database.models import EmotionModel
+from emotions.domain.entities.search_hit import SearchHit
+from emotions.domain.entities.streak import Streak
+from emotions.domain.value_objects.cursor import EmotionCursor
+from emotions.domain.value_objects.search_cursor import SearchCursor
+from emotions.infrastructure.database.models import (
+    SEARCH_CONFIG,
+    EmotionArchiveModel,
+    EmotionModel,
+    colombia_midnight,
+    to_colombia
+)
+from emotions.infrastructure.database.streak_queries import streak_runs
+
+
+# Columns selected by reads and returned by writes, mapped by _to_entity
+_COLUMNS = (
+    EmotionModel.id,
+    EmotionModel.user_id,
+    EmotionModel.title,
+    EmotionModel.text,
+    EmotionModel.ai_response,
+    EmotionModel.created_at
+)
+
+# Columns sparse fieldsets may leave out
+_OPTIONAL_COLUMNS = frozenset({"title", "text", "ai_response"})
+
+
+def _select_columns(columns, fields: Collection[str] | None) -> list:
+    """Columns to select, with optional ones missing from fields replaced by NULL.
+    
+    The row keeps the shape _to_entity expects, while PostgreSQL never reads
+    or detoasts the skipped values and they cost one bit on the wire.
+    """
+    if fields is None:
+        return list(columns)
+    return [
+        null().label(c.key) if c.key in _OPTIONAL_COLUMNS and c.key not in fields else c
+        for c in columns
+    ]
+
+
+def _archived_select(user_id: UUID, fields: Collection[str] | None = None):
+    """Select archived emotions of a user, shaped like a select of _COLUMNS.
+    
+    Returns the statement and the expanded payload rows, for filters on
+    their created_at and id. Payloads are only decompressed for archive rows
+    that pass the filters on EmotionArchiveModel columns.
+    """
+    rows = func.jsonb_to_recordset(EmotionArchiveModel.payload).table_valued(
+        *(
+            column(c.key, EmotionModel.__table__.c[c.key].type)
+            for c in _COLUMNS
+            if c.key != "user_id"
+        ),
+        name="archived"
+    ).render_derived(with_types=True)
+    columns = [
+        EmotionArchiveModel.user_id if c.key == "user_id" else rows.c[c.key]
+        for c in _COLUMNS
+    ]
+    
+    stmt = select(*_select_columns(columns, fields)).select_from(
+        EmotionArchiveModel
+    ).join(rows, true()).where(EmotionArchiveModel.user_id == user_id)
+    return stmt, rows
+
+
+def _to_entity(row) -> Emotion:
+    """Map database row to domain entity with Colombia timezone."""
+    return Emotion(
+        user_id=row.user_id,
+        title=row.title,
+        text=row.text,
+        ai_response=row.ai_response,
+        id=row.id,
+        created_at=to_colombia(row.created_at)
+    )
 
 
 class EmotionRepository:
-    """Emotion repository with database operations."""
+    """Emotion repository with async database operations."""
     
-    def __init__(self, session: Session):
-        """Initialize with database session."""
+    def __init__(self, session: AsyncSession):
+        """Initialize with async database session."""
         self.session = session
     
-    def create(self, emotion: Emotion) -> Emotion:
-        """Create new emotion."""
-        model = EmotionModel(
+    async def create(self, emotion: Emotion) -> Emotion:
+        """Create new emotion with a single INSERT ... RETURNING."""
+        stmt = insert(EmotionModel).values(
             id=emotion.id,
             user_id=emotion.user_id,
             title=emotion.title,
             text=emotion.text,
             ai_response=emotion.ai_response,
             created_at=emotion.created_at
-        )
+        ).returning(*_COLUMNS)
         
-        self.session.add(model)
-        self.session.flush()
-        self.session.refresh(model)
-        
-        # Map back to domain entity with Colombia timezone
-        return Emotion(
-            user_id=model.user_id,
-            title=model.title,
-            text=model.text,
-            ai_response=model.ai_response,
-            id=model.id,
-            created_at=model.created_at_colombia
-        )
+        result = await self.session.execute(stmt)
+        return _to_entity(result.one())
     
-    def find_all_by_user(self, user_id: UUID) -> list[Emotion]:
-        """Find all emotions for a user, ordered by created_at desc."""
-        stmt = select(EmotionModel).where(
-            EmotionModel.user_id == user_id
-        ).order_by(desc(EmotionModel.created_at))
+    async def create_many(self, emotions: list[Emotion]) -> list[Emotion]:
+        """Insert many emotions with multi-row INSERT ... RETURNING.
         
-        result = self.session.execute(stmt)
-        models = result.scalars().all()
+        Emotions whose id already exists are skipped, so replaying a batch is
+        idempotent. Only the emotions actually inserted are returned, in no
+        particular order.
         
-        return [
-            Emotion(
-                user_id=model.user_id,
-                title=model.title,
-                text=model.text,
-                ai_response=model.ai_response,
-                id=model.id,
-                created_at=model.created_at_colombia
+        The primary key is (id, created_at), as the table is partitioned by
+        created_at, so a replay with another created_at would not conflict;
+        ids already stored are filtered out explicitly instead, including
+        those moved to the archive month of the incoming created_at.
+        """
+        if not emotions:
+            return []
+        
+        columns = [EmotionModel.__table__.c[c.key] for c in _COLUMNS]
+        batch = values(
+            *(column(c.name, c.type) for c in columns),
+            name="batch"
+        ).data([
+            (
+                emotion.id,
+                emotion.user_id,
+                emotion.title,
+                emotion.text,
+                emotion.ai_response,
+                emotion.created_at
             )
-            for model in models
-        ]
+            for emotion in emotions
+        ])
+        month = cast(
+            func.date_trunc("month", func.timezone("America/Bogota", batch.c.created_at)),
+            Date
+        )
+        archived = exists().where(
+            EmotionArchiveModel.user_id == batch.c.user_id,
+            EmotionArchiveModel.month == month,
+            EmotionArchiveModel.payload.contains(
+                func.jsonb_build_array(func.jsonb_build_object("id", batch.c.id))
+            )
+        )
+        new_rows = select(batch).where(~exists().where(EmotionModel.id == batch.c.id), ~archived)
+        
+        stmt = pg_insert(EmotionModel).from_select(
+            [c.name for c in columns],
+            new_rows
+        ).on_conflict_do_nothing(
+            index_elements=[EmotionModel.id, EmotionModel.created_at]
+        ).returning(*_COLUMNS)
+        
+        result = await self.session.execute(stmt)
+        return [_to_entity(row) for row in result.all()]
     
-    def has_emotion_on_date(self, user_id: UUID, check_date: date) -> bool:
-        """Check if user has any emotion on given date (Colombia timezone)."""
-        # Convert timestamp to Colombia timezone before extracting date
-        stmt = select(func.count(EmotionModel.id)).where(
-            and_(
-                EmotionModel.user_id == user_id,
-                func.date(func.timezone('America/Bogota', EmotionModel.created_at)) == check_date
+    async def find_all_by_user(
+        self,
+        user_id: UUID,
+        limit: int | None = None,
+        cursor: EmotionCursor | None = None,
+        from_date: date | None = None,
+        to_date: date | None = None,
+        fields: Collection[str] | None = None
+    ) -> list[Emotion]:
+        """Find emotions for a user, ordered by (created_at, id) desc.
+        
+        Local dates are turned into a created_at range (never a function of
+        the column), so the filter is a range scan of the
+        (user_id, created_at, id) index.
+        
+        Archived emotions are merged in. With a limit, an archived month is
+        only decompressed if the hot rows do not fill the page or reach past
+        its newest emotion, so recent pages cost one extra primary key probe.
+        
+        Args:
+            user_id: Owner of the emotions
+            limit: Maximum number of rows to return (all when None)
+            cursor: Keyset position; only rows strictly after it are returned
+            from_date: First Colombia timezone date included (unbounded when None)
+            to_date: Last Colombia timezone date included (unbounded when None)
+            fields: Optional columns to load (title, text, ai_response), all
+                when None; the others are None on the returned entities
+        """
+        hot = select(*_select_columns(_COLUMNS, fields)).where(
+            EmotionModel.user_id == user_id
+        )
+        archived, rows = _archived_select(user_id, fields)
+        
+        if from_date is not None:
+            start = colombia_midnight(from_date)
+            hot = hot.where(EmotionModel.created_at >= start)
+            archived = archived.where(
+                EmotionArchiveModel.last_created_at >= start,
+                rows.c.created_at >= start
+            )
+        if to_date is not None and to_date < date.max:
+            end = colombia_midnight(to_date + timedelta(days=1))
+            hot = hot.where(EmotionModel.created_at < end)
+            archived = archived.where(
+                EmotionArchiveModel.first_created_at < end,
+                rows.c.created_at < end
+            )
+        if cursor is not None:
+            hot = hot.where(
+                tuple_(EmotionModel.created_at, EmotionModel.id)
+                < tuple_(cursor.created_at, cursor.id),
+                # Redundant with the row comparison, which does not prune partitions
+                EmotionModel.created_at <= cursor.created_at
+            )
+            archived = archived.where(
+                EmotionArchiveModel.first_created_at <= cursor.created_at,
+                tuple_(rows.c.created_at, rows.c.id) < tuple_(cursor.created_at, cursor.id)
             )
+        if limit is not None:
+            page = hot.order_by(
+                desc(EmotionModel.created_at), desc(EmotionModel.id)
+            ).limit(limit).cte("hot")
+            # NULL unless the hot rows fill the page
+            oldest = select(
+                func.min(page.c.created_at)
+            ).having(func.count() >= limit).scalar_subquery()
+            unbounded = cast(literal("-infinity"), DateTime(timezone=True))
+            archived = archived.where(
+                EmotionArchiveModel.last_created_at >= func.coalesce(oldest, unbounded)
+            )
+            hot = select(page)
+        
+        merged = union_all(hot, archived).subquery()
+        stmt = select(merged).order_by(desc(merged.c.created_at), desc(merged.c.id)).limit(limit)
+        
+        result = await self.session.execute(stmt)
+        return [_to_entity(row) for row in result.all()]
+    
+    async def stream_all_by_user(
+        self,
+        user_id: UUID,
+        batch_size: int = 500,
+        fields: Collection[str] | None = None
+    ) -> AsyncIterator[Emotion]:
+        """Stream all emotions for a user, newest first, through a server-side cursor.
+        
+        Rows are fetched batch_size at a time, so memory stays flat regardless
+        of how many emotions the user has. Archived emotions are included;
+        fields works as in find_all_by_user.
+        """
+        hot = select(*_select_columns(_COLUMNS, fields)).where(
+            EmotionModel.user_id == user_id
         )
-        result = self.session.execute(stmt)
-        count = result.scalar()
-        return count > 0
+        archived, _ = _archived_select(user_id, fields)
+        merged = union_all(hot, archived).subquery()
+        stmt = select(merged).order_by(
+            desc(merged.c.created_at), desc(merged.c.id)
+        ).execution_options(yield_per=batch_size)
+        
+        result = await self.session.stream(stmt)
+        async for row in result:
+            yield _to_entity(row)
     
-    def get_emotion_dates_for_user(self, user_id: UUID) -> list[date]:
-        """Get all unique dates when user created emotions (Colombia timezone), ordered desc."""
-        # Convert timestamp to Colombia timezone before extracting date
+    async def search(
+        self,
+        user_id: UUID,
+        query: str,
+        limit: int,
+        cursor: SearchCursor | None = None,
+        fields: Collection[str] | None = None
+    ) -> list[SearchHit]:
+        """Full-text search a user's emotions, ordered by (rank, created_at, id) desc.
+        
+        Matching and ranking read the stored search_vector (GIN indexed)
+        instead of re-parsing text; snippets are generated only for
+        the rows of the returned page, since ts_headline re-parses the text.
+        Archived emotions have no search_vector and are not searched.
+        
+        Args:
+            user_id: Owner of the emotions
+            query: Web-search syntax (websearch_to_tsquery); never raises on bad syntax
+            limit: Maximum number of rows to return
+            cursor: Keyset position; only rows strictly after it are returned
+            fields: Optional columns to return, as in find_all_by_user; the
+                snippet is always computed
+        """
+        config = literal(SEARCH_CONFIG, REGCONFIG)
+        tsquery = func.websearch_to_tsquery(config, query)
+        rank = func.ts_rank(EmotionModel.search_vector, tsquery)
+        
+        page = select(*_COLUMNS, rank.label("rank")).where(
+            EmotionModel.user_id == user_id,
+            EmotionModel.search_vector.bool_op("@@")(tsquery)
+        )
+        if cursor is not None:
+            page = page.where(
+                tuple_(rank, EmotionModel.created_at, EmotionModel.id)
+                < tuple_(cast(cursor.rank, REAL), cursor.created_at, cursor.id)
+            )
+        page = page.order_by(
+            desc(rank), desc(EmotionModel.created_at), desc(EmotionModel.id)
+        ).limit(limit).subquery()
+        
+        snippet = func.ts_headline(
+            config,
+            page.c.text,
+            tsquery,
+            "StartSel=**, StopSel=**, MaxFragments=2, MaxWords=20, MinWords=5"
+        )
         stmt = select(
-            func.date(func.timezone('America/Bogota', EmotionModel.created_at)).label('emotion_date')
-        ).where(
-            EmotionModel.user_id == user_id
-        ).group_by(
-            func.date(func.timezone('America/Bogota', EmotionModel.created_at))
+            *_select_columns([page.c[c.key] for c in _COLUMNS], fields),
+            page.c.rank,
+            snippet.label("snippet")
         ).order_by(
-            desc('emotion_date')
+            desc(page.c.rank), desc(page.c.created_at), desc(page.c.id)
+        )
+        
+        result = await self.session.execute(stmt)
+        return [
+            SearchHit(emotion=_to_entity(row), rank=row.rank, snippet=row.snippet)
+            for row in result.all()
+        ]
+    
+    async def get_streak(self, user_id: UUID, today: date) -> Streak:
+        """Compute the user's streak from emotions, archived ones included, in a single statement.
+        
+        Args:
+            user_id: Owner of the emotions
+            today: Current date in Colombia timezone
+        """
+        runs = streak_runs(user_id)
+        
+        stmt = select(
+            func.coalesce(
+                func.bool_or(and_(runs.c.start_day <= today, runs.c.end_day >= today)), False
+            ).label('has_emotion_today'),
+            func.coalesce(
+                func.max(runs.c.length).filter(runs.c.end_day >= today - timedelta(days=1)), 0
+            ).label('current_streak'),
+            func.coalesce(func.max(runs.c.length), 0).label('longest_streak'),
+            func.max(runs.c.end_day).label('last_emotion_date')
         )
         
-        result = self.session.execute(stmt)
-        return [row[0] for row in result.fetchall()]
+        row = (await self.session.execute(stmt)).one()
+        return Streak(
+            has_emotion_today=row.has_emotion_today,
+            current_streak=row.current_streak,
+            longest_streak=row.longest_streak,
+            last_emotion_date=row.last_emotion_date
+        )
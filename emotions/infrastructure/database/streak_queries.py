@@ -0,0 +1,63 @@
+"""Shared SQL building blocks for streak computation."""
+
+from uuid import UUID
+
+from sqlalchemy import CTE, Integer, Subquery, cast, func, select, union_all
+
+from emotions.infrastructure.database.models import EmotionArchiveModel, EmotionModel
+
+
+def emotion_local_date():
+    """Emotion date in Colombia timezone."""
+    return func.date(func.timezone('America/Bogota', EmotionModel.created_at))
+
+
+def emotion_dates(user_id: UUID | None = None) -> Subquery:
+    """Local date of every emotion, hot or archived, with columns user_id and day.
+    
+    One row per emotion, so days with several emotions repeat.
+    
+    Args:
+        user_id: Restrict to one user; all users when None
+    """
+    hot = select(EmotionModel.user_id, emotion_local_date().label('day'))
+    archived = select(
+        EmotionArchiveModel.user_id,
+        func.unnest(EmotionArchiveModel.local_dates).label('day')
+    )
+    if user_id is not None:
+        hot = hot.where(EmotionModel.user_id == user_id)
+        archived = archived.where(EmotionArchiveModel.user_id == user_id)
+    return union_all(hot, archived).subquery('emotion_dates')
+
+
+def streak_runs(user_id: UUID | None = None) -> CTE:
+    """Runs of consecutive local dates per user (gaps and islands).
+    
+    Consecutive dates share the same ``day - row_number()`` value, so grouping
+    by it yields one row per run with columns user_id, start_day, end_day and
+    length.
+    
+    Args:
+        user_id: Restrict to one user; all users when None
+    """
+    dates = emotion_dates(user_id)
+    days = select(dates.c.user_id, dates.c.day).distinct().cte('days')
+    
+    islands = select(
+        days.c.user_id,
+        days.c.day,
+        (
+            days.c.day - cast(
+                func.row_number().over(partition_by=days.c.user_id, order_by=days.c.day),
+                Integer
+            )
+        ).label('grp')
+    ).cte('islands')
+    
+    return select(
+        islands.c.user_id,
+        func.min(islands.c.day).label('start_day'),
+        func.max(islands.c.day).label('end_day'),
+        func.count().label('length')
+    ).group_by(islands.c.user_id, islands.c.grp).cte('runs')
@@ -0,0 +1,222 @@
+"""User streak read model repository."""
+
+from datetime import date, timedelta
+from typing import Collection
+from uuid import UUID
+
+from sqlalchemy import BigInteger, case, delete, exists, func, literal, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by, array_agg, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.infrastructure.cache.read_cache import get_read_cache
+from common.infrastructure.database.session import after_commit
+from emotions.domain.entities.streak import Streak
+from emotions.infrastructure.database.models import (
+    EmotionArchiveModel,
+    EmotionModel,
+    UserStreakModel
+)
+from emotions.infrastructure.database.streak_queries import streak_runs
+
+
+# Columns written by inserts from _computed_streaks()
+_STREAK_COLUMNS = [
+    'user_id',
+    'current_streak',
+    'longest_streak',
+    'last_emotion_date',
+    'updated_at',
+    'version'
+]
+
+
+def _computed_streaks(user_id: UUID | None = None):
+    """Streak rows computed from the full emotion history, one per user."""
+    runs = streak_runs(user_id)
+    return select(
+        runs.c.user_id,
+        (
+            array_agg(aggregate_order_by(runs.c.length, runs.c.end_day.desc()))
+        )[1].label('current_streak'),
+        func.max(runs.c.length).label('longest_streak'),
+        func.max(runs.c.end_day).label('last_emotion_date'),
+        func.clock_timestamp().label('updated_at'),
+        literal(1, BigInteger).label('version')
+    ).group_by(runs.c.user_id)
+
+
+def _folded_streak(emotion_date: date) -> dict:
+    """SET clause folding emotion_date into an existing streak row."""
+    current_streak = case(
+        (UserStreakModel.last_emotion_date >= emotion_date, UserStreakModel.current_streak),
+        (
+            UserStreakModel.last_emotion_date == emotion_date - timedelta(days=1),
+            UserStreakModel.current_streak + 1
+        ),
+        else_=1
+    )
+    return {
+        UserStreakModel.current_streak: current_streak,
+        UserStreakModel.longest_streak: func.greatest(
+            UserStreakModel.longest_streak, current_streak
+        ),
+        UserStreakModel.last_emotion_date: func.greatest(
+            UserStreakModel.last_emotion_date, emotion_date
+        ),
+        UserStreakModel.updated_at: func.clock_timestamp(),
+        UserStreakModel.version: UserStreakModel.version + 1
+    }
+
+
+class UserStreakRepository:
+    """Maintain and read the per-user streak read model.
+    
+    Each row stores the run of consecutive days ending at last_emotion_date,
+    so reads are a primary-key lookup plus a comparison against today.
+    Every write also invalidates the user's read cache entries on commit.
+    """
+    
+    def __init__(self, session: AsyncSession):
+        """Initialize with async database session."""
+        self.session = session
+    
+    async def record_emotion_date(self, user_id: UUID, emotion_date: date) -> None:
+        """Fold a new emotion's local date into the user's streak.
+        
+        Call after inserting the emotion, in the same transaction. Users
+        with a row get a single UPDATE; otherwise the row is computed from
+        their full history, which already includes the new emotion, so
+        emotions written before the backfill still count.
+        
+        Dates older than the stored last_emotion_date leave the streak as is;
+        use rebuild() after inserting backdated emotions.
+        """
+        update_stmt = update(UserStreakModel).where(
+            UserStreakModel.user_id == user_id
+        ).values(_folded_streak(emotion_date))
+        result = await self.session.execute(update_stmt)
+        
+        if result.rowcount == 0:
+            insert_stmt = insert(UserStreakModel).from_select(
+                _STREAK_COLUMNS, _computed_streaks(user_id)
+            )
+            # A concurrent first write may insert the row first; fold into it instead
+            insert_stmt = insert_stmt.on_conflict_do_update(
+                index_elements=[UserStreakModel.user_id],
+                set_=_folded_streak(emotion_date)
+            )
+            await self.session.execute(insert_stmt)
+        after_commit(self.session, lambda: get_read_cache().invalidate_user(user_id))
+    
+    async def get_streak(self, user_id: UUID, today: date) -> Streak | None:
+        """Read the user's streak; None when the read model has no row.
+        
+        Args:
+            user_id: Owner of the streak
+            today: Current date in Colombia timezone
+        """
+        stmt = select(UserStreakModel).where(UserStreakModel.user_id == user_id)
+        result = await self.session.execute(stmt)
+        model = result.scalar_one_or_none()
+        
+        if not model:
+            return None
+        
+        is_current = model.last_emotion_date >= today - timedelta(days=1)
+        return Streak(
+            has_emotion_today=model.last_emotion_date == today,
+            current_streak=model.current_streak if is_current else 0,
+            longest_streak=model.longest_streak,
+            last_emotion_date=model.last_emotion_date
+        )
+    
+    async def get_version(self, user_id: UUID) -> int:
+        """Version of the user's emotions; 0 when the read model has no row.
+        
+        Changes whenever record_emotion_date() or rebuild() touch the user,
+        so it identifies the state of their emotions and streak.
+        """
+        stmt = select(UserStreakModel.version).where(UserStreakModel.user_id == user_id)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none() or 0
+    
+    async def bump_version(self, user_id: UUID | None = None) -> None:
+        """Mark users' emotions as changed without recomputing their streak.
+        
+        For rebuilds of other read models, so ETags and cached reads that
+        depend on them are refreshed.
+        
+        Args:
+            user_id: Bump one user; all users when None
+        """
+        stmt = update(UserStreakModel).values(version=UserStreakModel.version + 1)
+        if user_id is not None:
+            stmt = stmt.where(UserStreakModel.user_id == user_id)
+        await self.session.execute(stmt)
+        
+        cache = get_read_cache()
+        if user_id is None:
+            after_commit(self.session, cache.invalidate_all)
+        else:
+            after_commit(self.session, lambda: cache.invalidate_user(user_id))
+    
+    async def bump_versions(self, user_ids: Collection[UUID]) -> None:
+        """Like bump_version() for a set of users, in one statement."""
+        if not user_ids:
+            return
+        await self.session.execute(
+            update(UserStreakModel).where(
+                UserStreakModel.user_id.in_(user_ids)
+            ).values(version=UserStreakModel.version + 1)
+        )
+        
+        async def invalidate() -> None:
+            cache = get_read_cache()
+            for user_id in user_ids:
+                await cache.invalidate_user(user_id)
+        
+        after_commit(self.session, invalidate)
+    
+    async def rebuild(self, user_id: UUID | None = None) -> int:
+        """Recompute streak rows from emotions (backfill and drift repair).
+        
+        Rows updated by record_emotion_date() after the rebuild statement
+        started are left alone rather than overwritten with its snapshot.
+        Rewritten rows get their version bumped even if unchanged.
+        
+        Args:
+            user_id: Rebuild one user; all users when None
+        
+        Returns:
+            Number of rows written
+        """
+        stmt = insert(UserStreakModel).from_select(_STREAK_COLUMNS, _computed_streaks(user_id))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserStreakModel.user_id],
+            set_={
+                UserStreakModel.current_streak: stmt.excluded.current_streak,
+                UserStreakModel.longest_streak: stmt.excluded.longest_streak,
+                UserStreakModel.last_emotion_date: stmt.excluded.last_emotion_date,
+                UserStreakModel.updated_at: stmt.excluded.updated_at,
+                UserStreakModel.version: UserStreakModel.version + 1
+            },
+            where=UserStreakModel.updated_at < func.statement_timestamp()
+        )
+        result = await self.session.execute(stmt)
+        
+        # Drop rows for users that no longer have any emotion
+        orphans = delete(UserStreakModel).where(
+            ~exists().where(EmotionModel.user_id == UserStreakModel.user_id),
+            ~exists().where(EmotionArchiveModel.user_id == UserStreakModel.user_id)
+        )
+        if user_id is not None:
+            orphans = orphans.where(UserStreakModel.user_id == user_id)
+        await self.session.execute(orphans)
+        
+        cache = get_read_cache()
+        if user_id is None:
+            after_commit(self.session, cache.invalidate_all)
+        else:
+            after_commit(self.session, lambda: cache.invalidate_user(user_id))
+        
+        return result.rowcount
@@ -0,0 +1,44 @@
+"""PasswordHasher admission control tests."""
+
+import asyncio
+
+import pytest
+
+from auth.application.services.password_hasher import PasswordHasher
+from auth.domain.exceptions.auth_errors import PasswordHasherOverloadedError
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def hasher():
+    """Small hasher with a long queue timeout, so only the bound rejects."""
+    hasher = PasswordHasher(workers=2, queue_size=3, queue_timeout=30.0)
+    yield hasher
+    hasher.shutdown(wait=True)
+
+
+@pytest.mark.parametrize("extra", [1, 4])
+async def test_burst_beyond_bound_rejects_exactly_the_excess(hasher, extra):
+    calls = hasher.workers + hasher.queue_size + extra
+    results = await asyncio.gather(
+        *(hasher.hash("correct horse battery") for _ in range(calls)),
+        return_exceptions=True
+    )
+    
+    rejected = [r for r in results if isinstance(r, PasswordHasherOverloadedError)]
+    assert len(rejected) == extra
+    assert hasher.rejected == extra
+    assert hasher.completed == calls - extra
+    assert hasher.queue_depth == 0
+    assert hasher.in_flight == 0
+
+
+async def test_failed_hashes_are_not_counted_as_completed(hasher):
+    with pytest.raises(ValueError):
+        await hasher.hash("short")
+    await hasher.hash("correct horse battery")
+    
+    assert hasher.failed == 1
+    assert hasher.completed == 1
+    assert hasher.in_flight == 0
@@ -0,0 +1,25 @@
+"""Value object tests."""
+
+import pytest
+
+from auth.domain.value_objects.email import Email
+from auth.domain.value_objects.password import HashedPassword
+
+pytestmark = pytest.mark.unit
+
+
+def test_trusted_email_matches_validated_email():
+    trusted = Email.from_trusted("user@example.com")
+    
+    assert trusted == Email(value="user@example.com")
+    assert hash(trusted) == hash(Email(value="user@example.com"))
+    assert str(trusted) == "user@example.com"
+
+
+def test_trusted_hashed_password_verifies():
+    hashed = HashedPassword.from_plain("correct horse battery")
+    trusted = HashedPassword.from_trusted(hashed.value)
+    
+    assert trusted == hashed
+    assert trusted.verify("correct horse battery")
+    assert not trusted.verify("wrong password")
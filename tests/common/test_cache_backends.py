@@ -0,0 +1,152 @@
+"""Read cache backend tests.
+
+The Redis backend runs against fakeredis, skipped when it is not installed.
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from common.infrastructure.cache import backends
+from common.infrastructure.cache.backends import MemoryCacheBackend, RedisCacheBackend
+from common.infrastructure.cache.read_cache import ReadCache
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def redis_backend():
+    """Redis backend on an in-memory fake server."""
+    fakeredis = pytest.importorskip("fakeredis")
+    return RedisCacheBackend(fakeredis.FakeAsyncRedis(), ttl=60, prefix="test")
+
+
+async def test_redis_round_trip_with_ttl(redis_backend):
+    user_id = uuid4()
+    token, value = await redis_backend.get(user_id, "list")
+    assert value is None
+    
+    await redis_backend.set(user_id, "list", token, b"page")
+    
+    assert await redis_backend.get(user_id, "list") == (token, b"page")
+    assert 0 < await redis_backend.client.ttl(f"test:{user_id}:list") <= 60
+
+
+async def test_redis_invalidate_bumps_user_generation(redis_backend):
+    user_id, other_id = uuid4(), uuid4()
+    for owner in (user_id, other_id):
+        token, _ = await redis_backend.get(owner, "streak")
+        await redis_backend.set(owner, "streak", token, b"streak")
+    
+    await redis_backend.invalidate(user_id)
+    
+    new_token, value = await redis_backend.get(user_id, "streak")
+    assert value is None
+    assert new_token != token
+    assert (await redis_backend.get(other_id, "streak"))[1] == b"streak"
+    assert 60 < await redis_backend.client.ttl(f"test:{user_id}:gen") <= 120
+
+
+async def test_redis_rejects_entry_tagged_with_old_token(redis_backend):
+    user_id = uuid4()
+    # A fill that started before a write committed stores under the old token
+    stale_token, _ = await redis_backend.get(user_id, "list")
+    await redis_backend.invalidate(user_id)
+    await redis_backend.set(user_id, "list", stale_token, b"stale page")
+    
+    token, value = await redis_backend.get(user_id, "list")
+    assert value is None
+    assert token != stale_token
+
+
+async def test_redis_clear_invalidates_every_user(redis_backend):
+    user_id = uuid4()
+    token, _ = await redis_backend.get(user_id, "list")
+    await redis_backend.set(user_id, "list", token, b"page")
+    
+    await redis_backend.clear()
+    
+    assert (await redis_backend.get(user_id, "list"))[1] is None
+
+
+async def test_read_cache_coalesces_misses_and_reloads_after_invalidation(redis_backend):
+    cache = ReadCache(redis_backend)
+    user_id = uuid4()
+    loads = 0
+    
+    async def loader() -> bytes:
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0.01)
+        return f"page {loads}".encode()
+    
+    values = await asyncio.gather(*(cache.get_or_load(user_id, "list", loader) for _ in range(5)))
+    assert values == [b"page 1"] * 5
+    assert loads == 1
+    assert cache.coalesced == 4
+    
+    assert await cache.get_or_load(user_id, "list", loader) == b"page 1"
+    assert loads == 1
+    
+    await cache.invalidate_user(user_id)
+    assert await cache.get_or_load(user_id, "list", loader) == b"page 2"
+    assert loads == 2
+
+
+async def test_memory_evicts_least_recently_used():
+    backend = MemoryCacheBackend(max_size=2, ttl=60)
+    first, second, third = uuid4(), uuid4(), uuid4()
+    for user_id in (first, second):
+        token, _ = await backend.get(user_id, "list")
+        await backend.set(user_id, "list", token, b"page")
+    # Reading refreshes recency, so second becomes the oldest
+    await backend.get(first, "list")
+    
+    token, _ = await backend.get(third, "list")
+    await backend.set(third, "list", token, b"page")
+    
+    assert (await backend.get(first, "list"))[1] == b"page"
+    assert (await backend.get(second, "list"))[1] is None
+    assert (await backend.get(third, "list"))[1] == b"page"
+    assert backend.evictions == 1
+
+
+async def test_memory_expires_entries(monkeypatch):
+    backend = MemoryCacheBackend(max_size=10, ttl=60)
+    user_id = uuid4()
+    token, _ = await backend.get(user_id, "streak")
+    await backend.set(user_id, "streak", token, b"streak")
+    
+    now = backends.time.monotonic()
+    monkeypatch.setattr(backends.time, "monotonic", lambda: now + 61)
+    
+    assert (await backend.get(user_id, "streak"))[1] is None
+    assert backend.stats()["size"] == 0
+
+
+async def test_memory_clear_rejects_in_flight_fills():
+    backend = MemoryCacheBackend(max_size=10, ttl=60)
+    user_id = uuid4()
+    stale_token, _ = await backend.get(user_id, "list")
+    
+    await backend.clear()
+    await backend.set(user_id, "list", stale_token, b"stale page")
+    
+    assert (await backend.get(user_id, "list"))[1] is None
+
+
+async def test_memory_bounds_generations_with_a_new_epoch():
+    backend = MemoryCacheBackend(max_size=2, ttl=60)
+    user_id = uuid4()
+    stale_token, _ = await backend.get(user_id, "list")
+    
+    # Tracking more generations than max_size starts a new epoch
+    for _ in range(3):
+        await backend.invalidate(uuid4())
+    await backend.set(user_id, "list", stale_token, b"stale page")
+    
+    assert (await backend.get(user_id, "list"))[1] is None
+    token, _ = await backend.get(user_id, "list")
+    await backend.set(user_id, "list", token, b"page")
+    assert (await backend.get(user_id, "list"))[1] == b"page"
@@ -0,0 +1,89 @@
+"""Query budgets of the hot read endpoints.
+
+Integration tests: DATABASE_URL must point at a database migrated with
+``alembic upgrade head``; they are skipped otherwise. Requests go through
+httpx's ASGITransport so they run in the test's context, where
+assert_query_budget counts their statements.
+"""
+
+import os
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from api.index import app
+from common.infrastructure.observability.query_stats import assert_query_budget
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(not os.getenv("DATABASE_URL"), reason="DATABASE_URL is not set")
+]
+
+
+@pytest.fixture
+async def client():
+    """Client calling the app in-process; shuts the app down afterwards."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+    # Pooled connections belong to this test's event loop
+    await app.router.shutdown()
+
+
+@pytest.fixture
+async def auth(client) -> dict:
+    """Authorization header of a new user with a few emotions."""
+    credentials = {"email": f"budget-{uuid4().hex}@example.com", "password": "password123"}
+    response = await client.post("/api/register", json={"name": "Budget", **credentials})
+    assert response.status_code == 201
+    response = await client.post("/api/login", json=credentials)
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    for i in range(3):
+        response = await client.post(
+            "/api/emotions",
+            json={"title": f"Emotion {i}", "text": "Hoy me siento bien", "ai_response": "Genial"},
+            headers=headers
+        )
+        assert response.status_code == 201
+    return headers
+
+
+async def test_list_emotions_within_budget(client, auth):
+    with assert_query_budget(2):
+        response = await client.get("/api/emotions", params={"limit": 2}, headers=auth)
+    assert response.status_code == 200
+    
+    with assert_query_budget(2):
+        response = await client.get(
+            "/api/emotions",
+            params={"limit": 2, "cursor": response.json()["next_cursor"]},
+            headers=auth
+        )
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 1
+
+
+async def test_not_modified_list_only_reads_version(client, auth):
+    response = await client.get("/api/emotions", headers=auth)
+    
+    with assert_query_budget(1):
+        response = await client.get(
+            "/api/emotions",
+            headers={**auth, "If-None-Match": response.headers["ETag"]}
+        )
+    assert response.status_code == 304
+
+
+async def test_streak_within_budget(client, auth):
+    with assert_query_budget(2):
+        response = await client.get("/api/emotions/streak", headers=auth)
+    assert response.status_code == 200
+    assert response.json()["current_streak"] == 1
+
+
+async def test_over_budget_fails_listing_statements(client, auth):
+    with pytest.raises(AssertionError, match="Expected at most 1 queries, got 2") as error:
+        with assert_query_budget(1):
+            await client.get("/api/emotions/streak", headers=auth)
+    assert "SELECT" in str(error.value)